@@ -5,6 +5,7 @@ import anywhere in the codebase.  The preference must be set before
 PsychoPy initialises its audio subsystem.
 """
 
+import functools
 import logging
 
 _configured_device = None
@@ -50,32 +51,51 @@ def reconfigure_audio_fallback() -> None:
         if 'audioDevice' in prefs.hardware:
             prefs.hardware['audioDevice'] = []
         _configured_device = None
+        _enumerate_output_devices.cache_clear()
         _logger.info("Audio reconfigured to sounddevice fallback")
     except Exception:
         pass
 
 
-def list_audio_devices():
+def list_audio_devices(refresh: bool = False):
     """Return list of available audio output device names.
 
     Filters out legacy Windows virtual devices (MME Sound Mapper etc.)
-    that PTB cannot use.
+    that PTB cannot use.  The PortAudio enumeration is cached; pass
+    ``refresh=True`` to re-scan (e.g. after plugging in a device).
     """
+    if refresh:
+        _enumerate_output_devices.cache_clear()
+    return list(_enumerate_output_devices())
+
+
+def audio_device_index(device_name: str):
+    """Return the sounddevice index of an output device listed by
+    :func:`list_audio_devices`, or None if it is not known.
+    """
+    _enumerate_output_devices()  # make sure the index map is populated
+    return _output_device_indices.get(device_name)
+
+
+# name -> sounddevice index, filled alongside the cached enumeration
+_output_device_indices = {}
+
+
+@functools.lru_cache(maxsize=1)
+def _enumerate_output_devices() -> tuple:
     _LEGACY = {"Microsoft Sound Mapper", "Primary Sound Driver"}
+    _output_device_indices.clear()
     try:
         import sounddevice as sd
         devices = sd.query_devices()
-        output_devices = []
-        seen = set()
-        for d in devices:
+        for i, d in enumerate(devices):
             if d['max_output_channels'] > 0:
                 name = d['name']
-                if name not in seen and not any(leg in name for leg in _LEGACY):
-                    output_devices.append(name)
-                    seen.add(name)
-        return output_devices
+                if name not in _output_device_indices and not any(leg in name for leg in _LEGACY):
+                    _output_device_indices[name] = i
+        return tuple(_output_device_indices)
     except Exception:
-        return []
+        return ()
 
 
 # Auto-configure on import with system default
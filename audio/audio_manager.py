@@ -11,8 +11,11 @@ experiment_completed).
 
 from __future__ import annotations
 
+import hashlib
 import logging
+import os
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, Optional
 
@@ -23,6 +26,10 @@ from .tone_generator import generate_sine_tone
 
 logger = logging.getLogger(__name__)
 
+# Resolve the codebase root once; relative instruction dirs hang off it
+_PKG_ROOT = Path(__file__).resolve().parent.parent
+_DEFAULT_INSTRUCTION_DIR = _PKG_ROOT / "external_instruction_recordings"
+
 # Map instruction names to actual MP3 filenames
 _INSTRUCTION_FILES = {
     "close_your_eyes": "close_your_eyes.mp3",
@@ -31,6 +38,45 @@ _INSTRUCTION_FILES = {
     "next_participant_please": "next_participant_please.mp3",
     "experiment_completed": "We_have_successfully_completed.mp3",
 }
+_INSTRUCTION_ITEMS = tuple(_INSTRUCTION_FILES.items())
+_INSTRUCTION_FILENAMES = frozenset(_INSTRUCTION_FILES.values())
+
+# Backends whose Sound constructor may be called from several threads at
+# once.  PTB shares a single PsychPortAudio handle, so it loads serially.
+_PARALLEL_LOAD_LIBS = frozenset({"sounddevice"})
+
+# Pre-decoded PCM copies of the instruction MP3s, so later launches skip
+# the MP3 decode.  Lives in the user's home so frozen builds can use it.
+_WAV_CACHE_DIR = Path.home() / ".cache" / "lsci" / "audio"
+
+
+def _cached_wav(mp3_path: Path, st: os.stat_result) -> Path:
+    """Return a float32 WAV decoded from *mp3_path*, creating it if needed.
+
+    The cache key covers name, size and mtime, so replacing an MP3
+    invalidates its entry.  Returns *mp3_path* unchanged if soundfile is
+    unavailable or decoding fails.
+    """
+    try:
+        import soundfile as sf
+    except ImportError:
+        return mp3_path
+    try:
+        key = hashlib.sha256(
+            f"{mp3_path.name}|{st.st_size}|{st.st_mtime_ns}".encode("utf-8")
+        ).hexdigest()
+        wav_path = _WAV_CACHE_DIR / f"{key}.wav"
+        if not wav_path.exists():
+            data, sample_rate = sf.read(str(mp3_path), dtype="float32")
+            _WAV_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            tmp_path = wav_path.with_suffix(".tmp")
+            sf.write(str(tmp_path), data, sample_rate, subtype="FLOAT", format="WAV")
+            os.replace(tmp_path, wav_path)
+            logger.debug("Cached decoded instruction %s -> %s", mp3_path.name, wav_path)
+        return wav_path
+    except Exception as e:
+        logger.debug("WAV cache unavailable for %s: %s", mp3_path, e)
+        return mp3_path
 
 
 class AudioManager:
@@ -49,6 +95,7 @@ class AudioManager:
         self._sounds: Dict[str, object] = {}
         self._instructions: Dict[str, object] = {}
         self._sound_module = None
+        self._sound_dtype = np.float32  # widened to float64 if the backend insists
         self._available = False
         self._init_psychopy_sound()
         self._load_instructions(instruction_dir)
@@ -65,9 +112,28 @@ class AudioManager:
             self._available = False
 
     def _reinit_with_fallback(self) -> None:
-        """Re-initialize audio with fallback backend after device error."""
+        """Re-initialize audio with fallback backend after device error.
+
+        ``psychopy.sound`` binds ``Sound`` to a backend at import, so the
+        module is reloaded unless it is already on the preferred fallback
+        backend — in that case the updated prefs are probed with a
+        one-sample Sound first and the reload only happens if that fails.
+        """
         from audio import reconfigure_audio_fallback
         reconfigure_audio_fallback()
+        try:
+            from psychopy import prefs, sound
+            if sound.audioLib == prefs.hardware['audioLib'][0]:
+                sound.Sound(
+                    value=np.zeros((1, 1), dtype=self._sound_dtype),
+                    sampleRate=self._settings.sample_rate,
+                )
+                self._sound_module = sound
+                self._available = True
+                logger.info("PsychoPy audio re-initialized with fallback prefs (no reload)")
+                return
+        except Exception as e:
+            logger.info("Fallback probe failed (%s), reloading psychopy.sound", e)
         # Force PsychoPy to re-create sound backend
         try:
             import importlib
@@ -82,14 +148,26 @@ class AudioManager:
 
     def _make_sound(self, buf: np.ndarray) -> object:
         """Wrap a 1-D float32 numpy buffer in a PsychoPy Sound object."""
-        # PsychoPy expects (n_samples, n_channels) float array
-        buf_2d = buf.astype(np.float64).reshape(-1, 1)
+        # PsychoPy expects (n_samples, n_channels); the column view is free
+        buf_2d = np.ascontiguousarray(buf[:, None], dtype=self._sound_dtype)
         try:
             return self._sound_module.Sound(
                 value=buf_2d,
                 sampleRate=self._settings.sample_rate,
             )
         except Exception as e:
+            if self._sound_dtype is np.float32:
+                # Older backends only accept float64 — remember and retry
+                try:
+                    snd = self._sound_module.Sound(
+                        value=buf_2d.astype(np.float64),
+                        sampleRate=self._settings.sample_rate,
+                    )
+                    self._sound_dtype = np.float64
+                    logger.info("Audio backend rejected float32 buffers, using float64")
+                    return snd
+                except Exception:
+                    pass
             # Device error — try fallback backend
             logger.warning("Sound creation failed (%s), trying fallback", e)
             self._reinit_with_fallback()
@@ -104,13 +182,11 @@ class AudioManager:
             return
         if not instruction_dir:
             # Default to external_instruction_recordings relative to codebase root
-            instruction_dir = str(
-                Path(__file__).resolve().parent.parent / "external_instruction_recordings"
-            )
-
-        base = Path(instruction_dir)
-        if not base.is_absolute():
-            base = Path(__file__).resolve().parent.parent / base
+            base = _DEFAULT_INSTRUCTION_DIR
+        else:
+            base = Path(instruction_dir)
+            if not base.is_absolute():
+                base = _PKG_ROOT / base
 
         self._do_load_instructions(base)
 
@@ -124,24 +200,58 @@ class AudioManager:
 
     def _do_load_instructions(self, base: Path) -> None:
         """Attempt to load all instruction MP3s from the given directory."""
-        loaded = 0
-        for name, filename in _INSTRUCTION_FILES.items():
+        # One directory read instead of a stat per instruction file
+        try:
+            with os.scandir(base) as it:
+                present = {
+                    e.name: e for e in it
+                    if e.name in _INSTRUCTION_FILENAMES and e.is_file()
+                }
+        except OSError:
+            present = {}
+
+        jobs = []
+        for name, filename in _INSTRUCTION_ITEMS:
             mp3_path = base / filename
-            if mp3_path.exists():
-                try:
-                    snd = self._sound_module.Sound(str(mp3_path))
-                    self._instructions[name] = snd
-                    loaded += 1
-                    logger.debug("Loaded instruction: %s from %s", name, mp3_path)
-                except Exception as e:
-                    logger.warning(
-                        "Failed to load instruction '%s' (%s): %s",
-                        name, mp3_path, e,
-                    )
+            entry = present.get(filename)
+            if entry is not None:
+                jobs.append((name, mp3_path, entry.stat()))
             else:
                 logger.warning("Instruction MP3 not found: %s", mp3_path)
 
-        logger.info("Loaded %d/%d instruction MP3s", loaded, len(_INSTRUCTION_FILES))
+        audio_lib = getattr(self._sound_module, "audioLib", "")
+        if len(jobs) > 1 and audio_lib in _PARALLEL_LOAD_LIBS:
+            # Decode + buffer allocation overlap across files
+            with ThreadPoolExecutor(max_workers=len(jobs)) as pool:
+                results = list(pool.map(self._load_instruction, jobs))
+        else:
+            results = [self._load_instruction(job) for job in jobs]
+
+        logger.info(
+            "Loaded %d/%d instruction MP3s", sum(results), len(_INSTRUCTION_ITEMS),
+        )
+
+    def _load_instruction(self, job) -> bool:
+        """Load one ``(name, path, stat)`` instruction. Returns True on success."""
+        name, mp3_path, st = job
+        source = _cached_wav(mp3_path, st)
+        try:
+            try:
+                snd = self._sound_module.Sound(str(source))
+            except Exception:
+                if source == mp3_path:
+                    raise
+                # Stale or unreadable cache entry — use the MP3 directly
+                snd = self._sound_module.Sound(str(mp3_path))
+            self._instructions[name] = snd
+            logger.debug("Loaded instruction: %s from %s", name, source)
+            return True
+        except Exception as e:
+            logger.warning(
+                "Failed to load instruction '%s' (%s): %s",
+                name, mp3_path, e,
+            )
+            return False
 
     def pregenerate_training_tone(self, duration: float) -> None:
         """Pre-generate a continuous tone matching training shape display.
@@ -183,10 +293,17 @@ class AudioManager:
     def available(self) -> bool:
         return self._available
 
-    def play(self, tone_name: str) -> None:
+    @property
+    def schedules_onset(self) -> bool:
+        """True if ``play(..., when=t)`` can start a tone at a PTB-clock time."""
+        return self._available and getattr(self._sound_module, "audioLib", "") == "ptb"
+
+    def play(self, tone_name: str, when: Optional[float] = None) -> None:
         """Play a pre-generated tone by name.
 
         Safe to use as a ``win.callOnFlip()`` callback for vsync-synced onset.
+        With the PTB backend, *when* (PTB clock) schedules the onset in the
+        audio driver instead — see ``schedules_onset``.
         """
         if not self._available:
             return
@@ -195,7 +312,10 @@ class AudioManager:
             logger.warning("Unknown tone: %s", tone_name)
             return
         try:
-            snd.play()
+            if when is None:
+                snd.play()
+            else:
+                snd.play(when=when)
         except Exception as e:
             logger.error("Audio playback error: %s", e)
 
@@ -266,13 +386,22 @@ class AudioManager:
         if not self._available:
             return False
         try:
-            s = self._settings
-            test_buf = generate_sine_tone(
-                s.beep_frequency, 0.15, s.sample_rate, s.beep_volume,
-            )
-            test_snd = self._make_sound(test_buf)
+            test_snd = self._sounds.get("_test")
+            if test_snd is None:
+                # Synthesised once, then reused by every later test click
+                s = self._settings
+                test_snd = self._make_sound(generate_sine_tone(
+                    s.beep_frequency, 0.15, s.sample_rate, s.beep_volume,
+                ))
+                self._sounds["_test"] = test_snd
             test_snd.play()
-            time.sleep(0.2)
+            # Return as soon as the backend reports playback finished;
+            # backends without isPlaying simply run to the deadline
+            deadline = time.perf_counter() + 0.25
+            while time.perf_counter() < deadline:
+                if not getattr(test_snd, "isPlaying", True):
+                    break
+                time.sleep(0.001)
             test_snd.stop()
             return True
         except Exception as e:
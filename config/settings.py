@@ -7,9 +7,43 @@ from dataclasses import dataclass, field, asdict
 from pathlib import Path
 from typing import List
 
+try:
+    import orjson  # optional — faster (de)serialisation, stdlib json otherwise
+except ImportError:
+    orjson = None
 
-@dataclass
-class CameraSettings:
+# Bumped on every field assignment of any settings object; cached derived
+# values (to_dict, validate) are only reused while it is unchanged (and
+# while the list fields, which can change in place, hold the same items).
+_generation = 0
+
+
+class _Tracked:
+    """Base for settings dataclasses that records field assignments."""
+    __slots__ = ()
+
+    def __setattr__(self, name, value):
+        global _generation
+        _generation += 1
+        object.__setattr__(self, name, value)
+
+
+class _DerivedCache(_Tracked):
+    """Adds the slot ExperimentConfig keeps its cached derived values in."""
+    __slots__ = ("_derived",)
+
+
+class _PhaseDurations(_Tracked):
+    """Slots for TimingSettings' precomputed phase durations."""
+    __slots__ = (
+        "_training_phase_duration",
+        "_measurement_phase_duration",
+        "_total_trial_duration",
+    )
+
+
+@dataclass(slots=True)
+class CameraSettings(_Tracked):
     """Camera hardware parameters (mirrors basler_camera_test.py CameraConfig)."""
     model_name: str = "acA1440-220um"
     expected_serial: str = "40034984"
@@ -23,11 +57,18 @@ class CameraSettings:
     offset_x: int = 0            # ROI horizontal offset (multiples of 4)
     offset_y: int = 0            # ROI vertical offset (multiples of 4)
     gamma: float = 1.0          # 1.0 = linear (no gamma correction)
+    use_nvenc: bool = False     # record H.264 on the GPU (NVENC) instead of MJPG
+    mjpg_quality: int = 95      # MJPG JPEG quality 1-100 (lower = smaller, faster)
+    max_num_buffer: int = 8     # pylon grab buffers (used from the next StartGrabbing)
 
 
-@dataclass
-class TimingSettings:
-    """Trial timing parameters in seconds."""
+@dataclass(slots=True)
+class TimingSettings(_PhaseDurations):
+    """Trial timing parameters in seconds.
+
+    The phase durations are recomputed whenever a field is assigned, so
+    reading them is a plain attribute lookup.
+    """
     training_shape_duration: float = 1.5
     training_blank_duration: float = 0.5
     training_repetitions: int = 5
@@ -38,30 +79,46 @@ class TimingSettings:
     open_eyes_cue_duration: float = 0.5
     training_to_measurement_delay: float = 0.0  # Extra delay (sec) between training and measurement
 
-    @property
-    def training_phase_duration(self) -> float:
-        return self.training_repetitions * (
+    def __post_init__(self):
+        self._update_durations()
+
+    def __setattr__(self, name, value):
+        _Tracked.__setattr__(self, name, value)
+        # Skipped while __init__ is still assigning fields
+        if hasattr(self, "_total_trial_duration"):
+            self._update_durations()
+
+    def _update_durations(self) -> None:
+        training = self.training_repetitions * (
             self.training_shape_duration + self.training_blank_duration
         )
+        measurement = self.measurement_repetitions * (
+            self.measurement_beep_duration + self.measurement_silence_duration
+        )
+        object.__setattr__(self, "_training_phase_duration", training)
+        object.__setattr__(self, "_measurement_phase_duration", measurement)
+        object.__setattr__(self, "_total_trial_duration", (
+            training
+            + self.close_eyes_cue_duration
+            + measurement
+            + self.open_eyes_cue_duration
+        ))
+
+    @property
+    def training_phase_duration(self) -> float:
+        return self._training_phase_duration
 
     @property
     def measurement_phase_duration(self) -> float:
-        return self.measurement_repetitions * (
-            self.measurement_beep_duration + self.measurement_silence_duration
-        )
+        return self._measurement_phase_duration
 
     @property
     def total_trial_duration(self) -> float:
-        return (
-            self.training_phase_duration
-            + self.close_eyes_cue_duration
-            + self.measurement_phase_duration
-            + self.open_eyes_cue_duration
-        )
+        return self._total_trial_duration
 
 
-@dataclass
-class AudioSettings:
+@dataclass(slots=True)
+class AudioSettings(_Tracked):
     """Audio cue parameters."""
     sample_rate: int = 44100
     beep_frequency: float = 440.0
@@ -69,16 +126,37 @@ class AudioSettings:
     beep_volume: float = 0.5
 
 
-@dataclass
-class StimulusSettings:
+@dataclass(slots=True)
+class StimulusSettings(_Tracked):
     """Visual stimulus appearance parameters."""
     color_hex: str = "#FFFFFF"       # Shape fill/line colour as hex RGB
     use_images: bool = False         # True → use image files instead of shapes
     image_paths: List[str] = field(default_factory=list)  # Paths to image stimuli
 
 
-@dataclass
-class ExperimentConfig:
+# Accepted keys per section, so unknown JSON keys can be dropped on load
+_CAMERA_KEYS = frozenset(CameraSettings.__dataclass_fields__)
+_TIMING_KEYS = frozenset(TimingSettings.__dataclass_fields__)
+_AUDIO_KEYS = frozenset(AudioSettings.__dataclass_fields__)
+_STIMULUS_KEYS = frozenset(StimulusSettings.__dataclass_fields__)
+
+
+def _filter_keys(data: dict, keys: frozenset) -> dict:
+    """Return the subset of *data* whose keys are in *keys*."""
+    return {k: data[k] for k in data.keys() & keys}
+
+
+def _copy_tree(value):
+    """Copy the dicts and lists of an ``asdict`` result; leaves are shared."""
+    if isinstance(value, dict):
+        return {k: _copy_tree(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_copy_tree(v) for v in value]
+    return value
+
+
+@dataclass(slots=True)
+class ExperimentConfig(_DerivedCache):
     """Top-level experiment configuration with JSON load/save/validate."""
     shapes: List[str] = field(default_factory=lambda: [
         "circle", "square", "triangle", "star"
@@ -94,13 +172,28 @@ class ExperimentConfig:
     instruction_audio_dir: str = "external_instruction_recordings"
 
     def __post_init__(self):
+        # Bypasses _Tracked: the cache itself is not configuration
+        object.__setattr__(self, "_derived", {})
         if not self.output_base_dir:
             self.output_base_dir = str(
                 Path.home() / "lsci_experiment_output"
             )
 
+    def _cached(self, key: str, compute):
+        """Return ``compute()``, reusing the last result if nothing changed."""
+        stamp = (_generation, tuple(self.shapes), tuple(self.stimulus.image_paths))
+        hit = self._derived.get(key)
+        if hit is not None and hit[0] == stamp:
+            return hit[1]
+        value = compute()
+        self._derived[key] = (stamp, value)
+        return value
+
     def validate(self) -> List[str]:
         """Return list of validation error strings (empty = valid)."""
+        return list(self._cached("validate", self._collect_errors))
+
+    def _collect_errors(self) -> List[str]:
         errors = []
         if self.stimulus.use_images:
             if not self.stimulus.image_paths:
@@ -124,46 +217,36 @@ class ExperimentConfig:
         return errors
 
     def to_dict(self) -> dict:
-        return asdict(self)
+        """Return the config as nested dicts (a fresh copy on every call)."""
+        return _copy_tree(self._cached("to_dict", lambda: asdict(self)))
 
     def save(self, path: Path) -> None:
         """Save config to JSON file."""
         path.parent.mkdir(parents=True, exist_ok=True)
+        if orjson is not None:
+            path.write_bytes(orjson.dumps(self.to_dict(), option=orjson.OPT_INDENT_2))
+            return
         with open(path, "w", encoding="utf-8") as f:
             json.dump(self.to_dict(), f, indent=2)
 
     @classmethod
     def load(cls, path: Path) -> "ExperimentConfig":
         """Load config from JSON, falling back to defaults for missing keys."""
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        if orjson is not None:
+            data = orjson.loads(path.read_bytes())
+        else:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
         return cls._from_dict(data)
 
     @classmethod
     def _from_dict(cls, data: dict) -> "ExperimentConfig":
-        cam_data = data.get("camera", {})
-        cam = CameraSettings(**{
-            k: v for k, v in cam_data.items()
-            if k in CameraSettings.__dataclass_fields__
-        })
-
-        timing_data = data.get("timing", {})
-        timing = TimingSettings(**{
-            k: v for k, v in timing_data.items()
-            if k in TimingSettings.__dataclass_fields__
-        })
-
-        audio_data = data.get("audio", {})
-        audio = AudioSettings(**{
-            k: v for k, v in audio_data.items()
-            if k in AudioSettings.__dataclass_fields__
-        })
-
-        stim_data = data.get("stimulus", {})
-        stimulus = StimulusSettings(**{
-            k: v for k, v in stim_data.items()
-            if k in StimulusSettings.__dataclass_fields__
-        })
+        cam = CameraSettings(**_filter_keys(data.get("camera", {}), _CAMERA_KEYS))
+        timing = TimingSettings(**_filter_keys(data.get("timing", {}), _TIMING_KEYS))
+        audio = AudioSettings(**_filter_keys(data.get("audio", {}), _AUDIO_KEYS))
+        stimulus = StimulusSettings(
+            **_filter_keys(data.get("stimulus", {}), _STIMULUS_KEYS)
+        )
 
         return cls(
             shapes=data.get("shapes", cls.__dataclass_fields__["shapes"].default_factory()),
@@ -39,4 +39,10 @@ class Shape(Enum):
     @classmethod
     def from_string(cls, name: str) -> "Shape":
         """Convert string to Shape enum (case-insensitive)."""
-        return cls(name.lower())
+        shape = _SHAPES_BY_NAME.get(name.lower())
+        if shape is None:
+            return cls(name.lower())  # raises the usual ValueError
+        return shape
+
+
+_SHAPES_BY_NAME = {shape.value: shape for shape in Shape}
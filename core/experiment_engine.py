@@ -7,10 +7,14 @@ thread-bound and audio should live alongside it.
 
 from __future__ import annotations
 
+import functools
+import gc
 import logging
 import threading
+import time
 from datetime import datetime
-from typing import List, Optional
+from pathlib import Path
+from typing import List, Optional, Tuple
 
 from config.settings import ExperimentConfig
 from core.enums import ExperimentState, TrialPhase, Shape
@@ -19,11 +23,19 @@ from hardware.camera_base import CameraBackend
 from data.session_manager import SessionManager
 from data.event_logger import EventLogger
 from data.excel_logger import ExcelLogger
+from data.main_experiment_monitor import MainExperimentMonitor
+from data.app_memory import AppMemory
 from utils.threading_utils import ExperimentWorker, AtomicFlag
 
 logger = logging.getLogger(__name__)
 
 
+def _emit_turn_beep(emit, base_beeps: int, total_in_turn: int,
+                    current: int, _trial_total: int) -> None:
+    """Map a trial-local beep count onto the whole subject turn."""
+    emit(base_beeps + current, total_in_turn)
+
+
 class ExperimentEngine:
     """Orchestrates the entire experiment session.
 
@@ -42,6 +54,7 @@ class ExperimentEngine:
         self.event_logger: Optional[EventLogger] = None
         self.excel_logger: Optional[ExcelLogger] = None
         self.queue: Optional[SessionQueue] = None
+        self._monitor: Optional[MainExperimentMonitor] = None
 
         self._state = ExperimentState.IDLE
         self._worker: Optional[ExperimentWorker] = None
@@ -51,8 +64,12 @@ class ExperimentEngine:
         self._pause_event = threading.Event()
         self._pause_event.set()  # Not paused initially
         self._confirm_event = threading.Event()
+        self._gl_released = threading.Event()
+        self._gl_released.set()  # Nothing to release before the first run
 
         self._subjects: List[str] = []
+        self._stim_names: Tuple[str, ...] = ()
+        self._use_images: bool = False
         self._screen_index: int = 0
         self._start_time: Optional[datetime] = None
 
@@ -82,13 +99,15 @@ class ExperimentEngine:
         self.event_logger = EventLogger(session_dir / "event_log.csv")
         self.excel_logger = ExcelLogger(session_dir / "session_log.xlsx")
 
-        # Determine stimulus names for the queue
+        # Determine stimulus names once; reused for the queue and in _run
         stim_cfg = self.config.stimulus
-        use_images = stim_cfg.use_images and stim_cfg.image_paths
+        use_images = bool(stim_cfg.use_images and stim_cfg.image_paths)
         if use_images:
-            stim_names = [f"image_{i}" for i in range(len(stim_cfg.image_paths))]
+            stim_names = tuple(f"image_{i}" for i in range(len(stim_cfg.image_paths)))
         else:
-            stim_names = self.config.shapes
+            stim_names = tuple(self.config.shapes)
+        self._use_images = use_images
+        self._stim_names = stim_names
 
         self.queue = SessionQueue(
             subjects,
@@ -104,10 +123,13 @@ class ExperimentEngine:
         """Reset all state for a clean start after stop.
 
         Ensures no leftover PsychoPy context or thread state prevents restart.
-        Forces garbage collection of OpenGL resources to prevent pyglet's
-        'Unable to share contexts' error on Windows.
+        If a previous worker ran, garbage collection of its OpenGL resources
+        (to prevent pyglet's 'Unable to share contexts' error on Windows)
+        happens on a background thread; the next run waits for it only if
+        it is still pending.
         """
-        if self._worker is not None:
+        had_worker = self._worker is not None
+        if had_worker:
             if self._worker.isRunning():
                 self._worker.wait(10000)  # Wait up to 10s for thread to finish
             self._worker = None
@@ -115,19 +137,26 @@ class ExperimentEngine:
         self._protocol = None
         self._win = None
 
-        # Force garbage collection to release pyglet/OpenGL contexts
-        import gc
-        gc.collect()
-
-        # Brief delay to let OpenGL driver fully release resources
-        import time
-        time.sleep(0.5)
+        if had_worker:
+            self._gl_released.clear()
+            threading.Thread(
+                target=self._release_gl_resources, daemon=True,
+            ).start()
 
         self._abort_flag.clear()
         self._pause_event.set()
         self._confirm_event.clear()
         self._state = ExperimentState.IDLE
 
+    def _release_gl_resources(self) -> None:
+        """Collect pyglet/OpenGL objects and let the driver release them."""
+        try:
+            gc.collect()
+            # Brief delay to let OpenGL driver fully release resources
+            time.sleep(0.5)
+        finally:
+            self._gl_released.set()
+
     def start(self) -> ExperimentWorker:
         """Launch the experiment worker thread."""
         self.reset()
@@ -153,7 +182,7 @@ class ExperimentEngine:
         """Resume from pause (retries the current shape)."""
         # Re-enable the protocol for the next trial run
         if self._protocol:
-            self._protocol._abort = False
+            self._protocol.clear_abort()
         self._pause_event.set()
         self._state = ExperimentState.RUNNING
         logger.info("Experiment resumed")
@@ -165,8 +194,7 @@ class ExperimentEngine:
     def request_abort(self) -> None:
         """Request graceful abort of the entire session."""
         self._abort_flag.set()
-        self._pause_event.set()   # Unblock if paused
-        self._confirm_event.set() # Unblock if waiting
+        self._pause_event.set()   # Unblock if paused (confirm wait polls the flag)
         if self._protocol:
             self._protocol.request_abort()
         logger.info("Abort requested")
@@ -190,6 +218,9 @@ class ExperimentEngine:
         self._start_time = datetime.now()
 
         try:
+            # Previous run's OpenGL context must be gone before a new one
+            self._gl_released.wait()
+
             # === Create PsychoPy resources on this thread ===
             from stimulus.stimulus_window import StimulusWindow
             from audio.audio_manager import AudioManager
@@ -201,16 +232,15 @@ class ExperimentEngine:
             )
             self._win = stim_window
 
-            # Prepare stimuli (shapes or images)
+            # Prepare stimuli (shapes or images) under the queue's names
             stim_cfg = self.config.stimulus
-            if stim_cfg.use_images and stim_cfg.image_paths:
-                from stimulus.shape_renderer import hex_to_psychopy
-                for i, img_path in enumerate(stim_cfg.image_paths):
-                    stim_window.prepare_image(f"image_{i}", img_path)
+            if self._use_images:
+                for name, img_path in zip(self._stim_names, stim_cfg.image_paths):
+                    stim_window.prepare_image(name, img_path)
             else:
                 from stimulus.shape_renderer import hex_to_psychopy
                 color = hex_to_psychopy(stim_cfg.color_hex)
-                for shape_name in self.config.shapes:
+                for shape_name in self._stim_names:
                     shape_enum = Shape.from_string(shape_name)
                     stim_window.prepare_shape(shape_enum, color=color)
 
@@ -219,25 +249,14 @@ class ExperimentEngine:
                 instruction_dir=self.config.instruction_audio_dir,
             )
 
-            # Pre-generate tones with frame-accurate durations.
-            t = self.config.timing
-            train_frames = stim_window.duration_to_frames(t.training_shape_duration)
-            train_dur = train_frames * stim_window.frame_duration
-            audio.pregenerate_training_tone(train_dur)
-
-            meas_frames = stim_window.duration_to_frames(t.measurement_beep_duration)
-            meas_dur = meas_frames * stim_window.frame_duration
-            audio.pregenerate_measurement_tone(meas_dur)
-
+            # TrialProtocol pre-generates the tones from its frame counts
             self._protocol = TrialProtocol(
-                t, audio, self.camera, self.event_logger, stim_window,
+                self.config.timing, audio, self.camera, self.event_logger, stim_window,
             )
 
             logger.info(
-                "PsychoPy ready: %.1f Hz, frame=%.3f ms, "
-                "training=%d frames (%.4fs), measurement=%d frames (%.4fs)",
+                "PsychoPy ready: %.1f Hz, frame=%.3f ms",
                 stim_window.frame_rate, stim_window.frame_duration * 1000,
-                train_frames, train_dur, meas_frames, meas_dur,
             )
 
             # === Run session ===
@@ -265,7 +284,9 @@ class ExperimentEngine:
                 w.stimulus_update.emit("idle")
                 self._state = ExperimentState.WAITING_CONFIRM
                 self._confirm_event.clear()
-                self._confirm_event.wait()
+                while not self._confirm_event.wait(0.1):
+                    if self._abort_flag.is_set:
+                        break
                 if self._abort_flag.is_set:
                     break
 
@@ -276,15 +297,19 @@ class ExperimentEngine:
                 is_last_queue_item = (self.queue.current_index == self.queue.total - 1)
                 total_shapes = len(item.shapes)
 
-                # Total beeps per shape for progress tracking
+                # Beep progress accumulates across the shapes of this turn
                 beeps_per_shape = (
                     self.config.timing.training_repetitions
                     + self.config.timing.measurement_repetitions
                 )
+                total_beeps_in_turn = total_shapes * beeps_per_shape
+                base_beeps = 0
+                progress_prefix = f"{item.subject} | Rep {item.rep} |"
 
                 # Run all shapes for this queue item (with pause/retry support)
                 all_ok = True
                 shape_idx = 0
+                instance_counts = {}  # shape -> completed occurrences this item
                 while shape_idx < len(item.shapes):
                     if self._abort_flag.is_set:
                         all_ok = False
@@ -299,30 +324,23 @@ class ExperimentEngine:
                     shape = item.shapes[shape_idx]
                     is_last_shape = (shape_idx == len(item.shapes) - 1)
 
-                    # Get string name for this shape/image
-                    shape_name = shape.value if hasattr(shape, "value") else str(shape)
+                    shape_name = item.shape_names[shape_idx]
 
-                    # Track shape instance for filename
-                    shape_instance = sum(
-                        1 for s in item.shapes[:shape_idx + 1]
-                        if s == shape
-                    )
+                    # Track shape instance for filename (only committed to
+                    # instance_counts once the trial completes, so retries
+                    # reuse the same number)
+                    shape_instance = instance_counts.get(shape, 0) + 1
 
-                    ts = datetime.now().strftime("%Y%m%d_%H%M%S")
+                    ts = time.strftime("%Y%m%d_%H%M%S")
                     video_path = self.session_mgr.trial_video_path(
                         item.subject, item.rep, shape_name, ts,
                         shape_instance=shape_instance,
                     )
 
                     w.progress_text.emit(
-                        f"{item.subject} | Rep {item.rep} | {shape_name} "
-                        f"({shape_idx + 1}/{total_shapes})"
+                        f"{progress_prefix} {shape_name} ({shape_idx + 1}/{total_shapes})"
                     )
 
-                    # Beep progress: accumulate across shapes in this turn
-                    base_beeps = shape_idx * beeps_per_shape
-                    total_beeps_in_turn = total_shapes * beeps_per_shape
-
                     ok = self._protocol.run(
                         shape=shape,
                         subject=item.subject,
@@ -330,10 +348,11 @@ class ExperimentEngine:
                         video_path=video_path,
                         is_last_shape=is_last_shape,
                         is_last_queue_item=is_last_queue_item,
-                        on_phase_change=lambda ph, rem: w.phase_changed.emit(ph, rem),
-                        on_stimulus_update=lambda st: w.stimulus_update.emit(st),
-                        on_beep_progress=lambda cur, tot: w.beep_progress.emit(
-                            base_beeps + cur, total_beeps_in_turn,
+                        on_phase_change=w.phase_changed.emit,
+                        on_stimulus_update=w.stimulus_update.emit,
+                        on_beep_progress=functools.partial(
+                            _emit_turn_beep, w.beep_progress.emit,
+                            base_beeps, total_beeps_in_turn,
                         ),
                     )
 
@@ -363,13 +382,15 @@ class ExperimentEngine:
                                 break
                             # Reset protocol for retry — DON'T advance shape_idx
                             if self._protocol:
-                                self._protocol._abort = False
+                                self._protocol.clear_abort()
                             w.state_changed.emit(ExperimentState.RUNNING)
                             continue  # Retry same shape
                     else:
                         w.trial_completed.emit(
                             item.subject, shape_name, item.rep, "completed",
                         )
+                        instance_counts[shape] = shape_instance
+                        base_beeps += beeps_per_shape
                         shape_idx += 1  # Advance to next shape
 
                 if all_ok:
@@ -415,17 +436,25 @@ class ExperimentEngine:
             w.session_finished.emit()
             if self.event_logger:
                 self.event_logger.close()
+            if self.excel_logger:
+                try:
+                    self.excel_logger.close()
+                except Exception as e:
+                    logger.warning("Failed to write session Excel log: %s", e)
 
     @staticmethod
     def _discard_video(video_path) -> None:
         """Delete a partial/interrupted video file."""
+        if not video_path:
+            return
         try:
-            import os
-            if video_path and os.path.exists(video_path):
-                os.remove(video_path)
-                logger.info("Discarded interrupted recording: %s", video_path)
+            Path(video_path).unlink()
+        except FileNotFoundError:
+            return
         except Exception as e:
             logger.warning("Could not delete video %s: %s", video_path, e)
+            return
+        logger.info("Discarded interrupted recording: %s", video_path)
 
     def _check_pause(self, w: ExperimentWorker) -> None:
         """Block until unpaused (or abort)."""
@@ -436,16 +465,15 @@ class ExperimentEngine:
     def _log_to_monitor(self, end_time: datetime, status: str) -> None:
         """Log session summary to the main experiment monitor."""
         try:
-            from data.main_experiment_monitor import MainExperimentMonitor
-
             cam = self.config.camera
             camera_summary = (
                 f"{cam.width}x{cam.height} {cam.pixel_format} "
                 f"{cam.exposure_time_us}us {cam.gain_db}dB {cam.target_frame_rate}fps"
             )
 
-            monitor = MainExperimentMonitor(self.config.output_base_dir)
-            monitor.log_session(
+            if self._monitor is None:
+                self._monitor = MainExperimentMonitor(self.config.output_base_dir)
+            self._monitor.log_session(
                 start_time=self._start_time or end_time,
                 end_time=end_time,
                 status=status,
@@ -462,11 +490,11 @@ class ExperimentEngine:
     def _save_to_app_memory(self) -> None:
         """Save session data to persistent app memory."""
         try:
-            from data.app_memory import AppMemory
+            # Fresh instance on purpose: it reloads whatever the GUI saved
             memory = AppMemory()
             memory.add_subjects(self._subjects)
-            memory.last_output_folder = self.config.output_base_dir
-            memory.update_settings(self.config.to_dict())
-            memory.save()
+            memory.update_settings(
+                self.config.to_dict(), self.config.output_base_dir,
+            )
         except Exception as e:
             logger.warning("Failed to save to app memory: %s", e)
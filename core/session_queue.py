@@ -2,18 +2,24 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from typing import List, Union
+from dataclasses import dataclass
+from typing import List, Sequence, Tuple, Union
 
 from .enums import Shape
 
 
-@dataclass
+@dataclass(slots=True)
 class QueueItem:
-    """One entry in the session queue: a subject's full shape set for one rep."""
+    """One entry in the session queue: a subject's full shape set for one rep.
+
+    ``shapes`` is an immutable tuple shared by every item in the queue;
+    ``shape_names`` holds the matching string names (enum values, or the
+    raw image names in image mode).
+    """
     subject: str
     rep: int
-    shapes: List[Union[Shape, str]] = field(default_factory=list)
+    shapes: Sequence[Union[Shape, str]] = ()
+    shape_names: Sequence[str] = ()
     completed: bool = False
 
     @property
@@ -43,28 +49,41 @@ class SessionQueue:
         shape_reps_per_subsession: int = 1,
         use_raw_names: bool = False,
     ):
-        self._items: List[QueueItem] = []
+        items: List[QueueItem] = []
 
+        # Built once and shared by all items — nothing mutates it per item
         if use_raw_names:
             # Image mode: use strings directly (e.g. "image_0", "image_1")
-            expanded = list(shapes) * shape_reps_per_subsession
+            expanded = tuple(shapes) * shape_reps_per_subsession
+            names = expanded
         else:
-            shape_enums = [Shape.from_string(s) for s in shapes]
-            expanded = list(shape_enums) * shape_reps_per_subsession
+            expanded = (
+                tuple(Shape.from_string(s) for s in shapes)
+                * shape_reps_per_subsession
+            )
+            names = tuple(s.value for s in expanded)
 
         for rep in range(1, repetitions + 1):
             for subj in subjects:
-                self._items.append(QueueItem(
+                items.append(QueueItem(
                     subject=subj,
                     rep=rep,
-                    shapes=list(expanded),
+                    shapes=expanded,
+                    shape_names=names,
                 ))
 
+        # Fixed once built; only each item's ``completed`` flag changes
+        self._items: Tuple[QueueItem, ...] = tuple(items)
         self._index = 0
+        # Progress entries are built once and updated in place
+        self._progress_items = [
+            {"subject": item.subject, "rep": item.rep, "completed": item.completed}
+            for item in self._items
+        ]
 
     @property
-    def items(self) -> List[QueueItem]:
-        return list(self._items)
+    def items(self) -> Tuple[QueueItem, ...]:
+        return self._items
 
     @property
     def current(self) -> QueueItem | None:
@@ -88,6 +107,7 @@ class SessionQueue:
         """Mark current item completed and move to next. Returns new current or None."""
         if self._index < len(self._items):
             self._items[self._index].completed = True
+            self._progress_items[self._index]["completed"] = True
             self._index += 1
         return self.current
 
@@ -95,17 +115,12 @@ class SessionQueue:
         """Reset the current item for retry."""
         if self._index < len(self._items):
             self._items[self._index].completed = False
+            self._progress_items[self._index]["completed"] = False
 
     def to_progress_dict(self) -> dict:
-        """Serialize queue state for crash recovery."""
-        return {
-            "index": self._index,
-            "items": [
-                {
-                    "subject": item.subject,
-                    "rep": item.rep,
-                    "completed": item.completed,
-                }
-                for item in self._items
-            ],
-        }
+        """Serialize queue state for crash recovery.
+
+        The ``items`` list is the queue's live bookkeeping — serialise it,
+        don't mutate it.
+        """
+        return {"index": self._index, "items": self._progress_items}
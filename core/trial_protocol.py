@@ -9,11 +9,22 @@ PsychoPy provides hardware-level synchronisation:
 
 1. ``win.callOnFlip(sound.play)`` registers a callback that fires at the
    exact moment the back-buffer swaps to the display (vsync).  Audio
-   onset is therefore locked to visual onset within ~1 ms.
-
-2. All durations use *frame-counting* — ``for _ in range(n): win.flip()``
-   — so timing is determined by the display refresh rate, not by
-   sleep-based estimates.  No drift, no jitter.
+   onset is therefore locked to visual onset within ~1 ms.  With the PTB
+   audio backend the onset is instead scheduled in the driver for the
+   vsync the next flip lands on, counted in measured frames from the
+   last real flip, which removes the delay between the buffer swap and
+   the callback.
+
+2. All durations are counted in display frames.  Visual changes happen
+   only on a real ``win.flip()``; in between, the front buffer keeps
+   showing the last frame, so "hold for n frames" sleeps until half a
+   refresh before the vsync the next flip must land on (measured from
+   the previous flip) instead of flipping every refresh.  The measured
+   frame duration is never exact, so long holds redraw and re-flip the
+   current frame about once a second to re-lock to the real vsync; the
+   sequence of displayed frames matches ``for _ in range(n): win.flip()``
+   but Python only wakes at phase boundaries, re-anchor flips, and
+   briefly to check for abort.
 
 3. Tone buffers are pre-generated at exactly ``n_frames * frame_duration``
    seconds, so audio and visual are inherently duration-matched.
@@ -28,11 +39,14 @@ New instruction sequence (replaces old close/open-eyes cue tones):
 from __future__ import annotations
 
 import logging
+import threading
+import time
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Callable, Optional
 
 from config.settings import TimingSettings
 from core.enums import TrialPhase, Shape
-from utils.timing import precise_sleep
+from utils.timing import precise_sleep, ptb_clock_offset
 
 if TYPE_CHECKING:
     from audio.audio_manager import AudioManager
@@ -43,6 +57,74 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Point before a deadline at which a hold stops waiting on the abort event
+# and switches to precise_sleep (kept above Windows' ~15.6 ms timer
+# granularity so the coarse wait can never overshoot the deadline).
+_FINAL_WAIT_S = 0.05
+
+# Longest stretch a hold runs open-loop on the measured frame duration
+# before re-flipping the current frame; keeps accumulated error in the
+# deadline far below half a refresh
+_REANCHOR_S = 1.0
+
+# Least lead (in frames) a scheduled PTB onset needs before its vsync;
+# holds wake half a frame early, so this leaves room for the signals
+# emitted between a hold and the next flip
+_MIN_ONSET_LEAD_FRAMES = 0.25
+
+# (is_last_shape, is_last_queue_item) -> (stimulus state, instruction, event)
+_OPEN_EYES = ("instruction:open_your_eyes", "open_your_eyes", "INSTRUCTION_OPEN_EYES")
+_POST_MEASUREMENT = {
+    # More shapes remain for this subject's turn
+    (False, False): _OPEN_EYES,
+    (False, True): _OPEN_EYES,
+    # Last shape of this turn, but more items remain (next participant
+    # or same participant's next repetition)
+    (True, False): (
+        "instruction:next_participant", "next_participant_please",
+        "INSTRUCTION_NEXT_PARTICIPANT",
+    ),
+    # Truly the last shape of the last queue item — session complete
+    (True, True): (
+        "instruction:experiment_completed", "experiment_completed",
+        "INSTRUCTION_COMPLETED",
+    ),
+}
+
+
+@dataclass(frozen=True, slots=True)
+class FrameCounts:
+    """Frame count of every trial phase at the measured refresh rate."""
+    shape: int
+    blank: int
+    beep: int
+    silence: int
+    train_to_meas_delay: int   # 0 when no extra delay is configured
+    close_eyes_wait: int
+    starting_wait: int
+    recording_margin: int
+    post_wait: int
+
+    @classmethod
+    def from_timing(cls, timing: TimingSettings, frame_rate: float) -> "FrameCounts":
+        def frames(duration_sec: float) -> int:
+            # Same rounding as StimulusWindow.duration_to_frames
+            return max(1, round(duration_sec * frame_rate))
+
+        five_sec = frames(5.0)  # close-eyes wait and post-measurement wait
+        delay = timing.training_to_measurement_delay
+        return cls(
+            shape=frames(timing.training_shape_duration),
+            blank=frames(timing.training_blank_duration),
+            beep=frames(timing.measurement_beep_duration),
+            silence=frames(timing.measurement_silence_duration),
+            train_to_meas_delay=frames(delay) if delay > 0 else 0,
+            close_eyes_wait=five_sec,
+            starting_wait=frames(2.0),
+            recording_margin=frames(1.0),
+            post_wait=five_sec,
+        )
+
 
 class TrialProtocol:
     """Executes a single shape trial with frame-accurate audio/visual sync.
@@ -64,32 +146,133 @@ class TrialProtocol:
         self._camera = camera
         self._events = event_logger
         self._win = stim_window
-        self._abort = False
+        # Recording rate; camera settings are fixed once the session starts
+        cam_settings = getattr(camera, "_settings", None)
+        self._fps = cam_settings.target_frame_rate if cam_settings else 500.0
+        # Set from the GUI thread; holds wait on it, so an abort wakes them
+        # immediately instead of being noticed at the next poll
+        self._abort = threading.Event()
+        self._frame_dur = stim_window.frame_duration
+        self._t_flip = time.perf_counter()   # perf_counter of the last real flip
+        self._frames_held = 0                # frames held since that flip
+        self._redraw: Optional[Callable[[], None]] = None  # draws the frame on screen
+        self._reanchor_frames = max(2, round(_REANCHOR_S * stim_window.frame_rate))
 
         # Pre-compute frame counts (constant for all trials)
-        self._n_shape = stim_window.duration_to_frames(timing.training_shape_duration)
-        self._n_blank = stim_window.duration_to_frames(timing.training_blank_duration)
-        self._n_beep = stim_window.duration_to_frames(timing.measurement_beep_duration)
-        self._n_silence = stim_window.duration_to_frames(timing.measurement_silence_duration)
-
-        # Instruction wait durations (frame-counted for consistency)
-        self._n_close_eyes_wait = stim_window.duration_to_frames(5.0)
-        self._n_starting_wait = stim_window.duration_to_frames(2.0)
-        self._n_recording_margin = stim_window.duration_to_frames(1.0)
-
-        # Extra delay between training and measurement phases
-        delay = timing.training_to_measurement_delay
-        self._n_train_to_meas_delay = stim_window.duration_to_frames(delay) if delay > 0 else 0
+        self._frames = FrameCounts.from_timing(timing, stim_window.frame_rate)
+        f = self._frames
 
         logger.info(
             "Frame counts — shape:%d blank:%d beep:%d silence:%d "
             "close_wait:%d start_wait:%d",
-            self._n_shape, self._n_blank, self._n_beep,
-            self._n_silence, self._n_close_eyes_wait, self._n_starting_wait,
+            f.shape, f.blank, f.beep,
+            f.silence, f.close_eyes_wait, f.starting_wait,
         )
 
+        # Per-repetition event tags (repetition counts are fixed per config)
+        self._flash_tags = tuple(f"flash_{i + 1}" for i in range(timing.training_repetitions))
+        self._beep_tags = tuple(f"beep_{i + 1}" for i in range(timing.measurement_repetitions))
+
+        # Tone buffers are sized from the same frame counts the flips use,
+        # so audio and visual durations match exactly
+        audio.pregenerate_training_tone(f.shape * self._frame_dur)
+        audio.pregenerate_measurement_tone(f.beep * self._frame_dur)
+        # Checked after the tones exist: a device error while creating them
+        # may have switched the backend away from PTB
+        self._scheduled_onset = audio.schedules_onset
+        if self._scheduled_onset:
+            try:
+                ptb_clock_offset()
+            except ImportError as e:
+                logger.warning(
+                    "PTB clock unavailable (%s), starting tones from callOnFlip", e,
+                )
+                self._scheduled_onset = False
+
     def request_abort(self) -> None:
-        self._abort = True
+        self._abort.set()
+
+    def clear_abort(self) -> None:
+        """Re-arm the protocol after an abort (e.g. before a retry)."""
+        self._abort.clear()
+
+    def _play_and_log(self, sound: str, *event: str) -> None:
+        """callOnFlip target: start *sound*, then log *event* (one entry per flip)."""
+        self._audio.play(sound)
+        self._events.log(*event)
+
+    def _start_on_flip(self, sound: str, *event: str) -> None:
+        """Start *sound* with the next flip and log *event* when it lands.
+
+        With the PTB backend the onset is handed to the audio driver for
+        the vsync the next flip lands on (one measured frame after the
+        frames already held since the last flip), so it no longer waits
+        for the flip call to return; otherwise the sound starts from the
+        callOnFlip callback.  That path is also used when work since the
+        last hold (signals, starting the camera) leaves less than
+        ``_MIN_ONSET_LEAD_FRAMES`` before that vsync, where a scheduled
+        onset could already be stale or in the past.
+        """
+        if self._scheduled_onset:
+            t_next = self._t_flip + (self._frames_held + 1) * self._frame_dur
+            if t_next - time.perf_counter() >= _MIN_ONSET_LEAD_FRAMES * self._frame_dur:
+                self._audio.play(sound, when=t_next + ptb_clock_offset())
+                self._win.call_on_flip(self._events.log, *event)
+                return
+        self._win.call_on_flip(self._play_and_log, sound, *event)
+
+    def _stop_and_log(self, sound: str, *event: str) -> None:
+        """callOnFlip target: stop *sound*, then log *event*."""
+        self._audio.stop(sound)
+        self._events.log(*event)
+
+    def _flip(self, draw: Optional[Callable[[], None]] = None) -> None:
+        """Draw with *draw* (None for a black frame), flip at the next vsync
+        and restart frame bookkeeping from it.
+
+        *draw* is kept so that re-anchoring flips in ``_hold`` can put the
+        same frame on screen again.
+        """
+        if draw is not None:
+            draw()
+        self._win.flip()
+        self._t_flip = time.perf_counter()
+        self._frames_held = 0
+        self._redraw = draw
+
+    def _hold(self, n_frames: int) -> bool:
+        """Keep the current frame on screen for *n_frames* more refreshes.
+
+        A ``_flip()`` issued after this returns lands on the vsync the
+        ``n_frames``-th bare flip would have used, plus one.  Holds that
+        would run longer than ``_REANCHOR_S`` since the last flip spend
+        one of their frames on a real flip of the same frame, so the
+        deadline is re-measured from an actual vsync rather than
+        extrapolated.  Returns False if the trial was aborted while waiting.
+        """
+        while n_frames > 0:
+            step = self._reanchor_frames - self._frames_held
+            if n_frames < step:
+                self._frames_held += n_frames
+                deadline = self._t_flip + (self._frames_held + 0.5) * self._frame_dur
+                return self._sleep_until(deadline)
+            # Hold step - 1 frames, then re-flip for the step-th
+            self._frames_held += step - 1
+            deadline = self._t_flip + (self._frames_held + 0.5) * self._frame_dur
+            if not self._sleep_until(deadline):
+                return False
+            self._flip(self._redraw)
+            n_frames -= step
+        return not self._abort.is_set()
+
+    def _sleep_until(self, deadline: float) -> bool:
+        """Sleep until *deadline* (perf_counter); False as soon as aborted."""
+        abort = self._abort
+        coarse = deadline - time.perf_counter() - _FINAL_WAIT_S
+        if coarse > 0 and abort.wait(coarse):
+            return False
+        precise_sleep(deadline - time.perf_counter())
+        return not abort.is_set()
 
     def run(
         self,
@@ -119,11 +302,20 @@ class TrialProtocol:
         Returns True if completed normally, False if aborted.
         """
         t = self._timing
-        self._abort = False
+        abort = self._abort
+        abort.clear()
+        # Anchor frame bookkeeping on a real vsync (the screen is black
+        # between trials anyway)
+        self._flip()
 
         # Normalize shape to a string name (supports Shape enum or plain string)
         shape_name = shape.value if hasattr(shape, "value") else str(shape)
 
+        # Logged strings built up front, not on the callOnFlip path
+        rep_str = str(rep)
+        flash_tags = self._flash_tags
+        beep_tags = self._beep_tags
+
         # Total beeps in this trial (training + measurement) for progress tracking
         total_beeps = t.training_repetitions + t.measurement_repetitions
         beep_counter = 0
@@ -142,159 +334,145 @@ class TrialProtocol:
             if on_beep_progress:
                 on_beep_progress(beep_counter, total_beeps)
 
-        self._events.log("TRIAL_START", subject, shape_name, str(rep))
+        # Bound once per trial; used on every phase boundary below
+        draw = self._win.shape_drawer(shape_name)
+        on_flip = self._win.call_on_flip
+        flip = self._flip
+        hold = self._hold
+        log = self._events.log
+        # Sound + log pairs go through one callOnFlip entry each
+        start_on_flip = self._start_on_flip
+        stop_and_log = self._stop_and_log
+
+        log("TRIAL_START", subject, shape_name, rep_str)
 
         # ===== Training phase =====
         for i in range(t.training_repetitions):
-            if self._abort:
+            if abort.is_set():
                 return False
 
             _phase(TrialPhase.TRAINING_SHAPE, t.training_shape_duration)
             _stim(f"shape:{shape_name}")
 
             # --- Frame 1: shape appears + audio starts at vsync ---
-            self._win.draw_shape(shape_name)
-            self._win.call_on_flip(self._audio.play, "training")
-            self._win.call_on_flip(
-                self._events.log,
-                "TRAINING_SHAPE_ON", subject, shape_name, str(rep),
-                f"flash_{i+1}",
+            start_on_flip(
+                "training",
+                "TRAINING_SHAPE_ON", subject, shape_name, rep_str,
+                flash_tags[i],
             )
-            self._win.flip()
+            flip(draw)
             _beep()
 
-            # --- Sustain shape for remaining frames ---
-            for _ in range(self._n_shape - 1):
-                if self._abort:
-                    self._audio.stop("training")
-                    return False
-                self._win.draw_shape(shape_name)
-                self._win.flip()
+            # --- Sustain shape for remaining frames (stays in front buffer) ---
+            if not hold(self._frames.shape - 1):
+                self._audio.stop("training")
+                return False
 
             # --- Clear frame: shape disappears + audio stops at vsync ---
-            self._win.call_on_flip(self._audio.stop, "training")
-            self._win.call_on_flip(
-                self._events.log,
-                "TRAINING_SHAPE_OFF", subject, shape_name, str(rep),
-                f"flash_{i+1}",
+            on_flip(
+                stop_and_log, "training",
+                "TRAINING_SHAPE_OFF", subject, shape_name, rep_str,
+                flash_tags[i],
             )
-            self._win.flip()  # Black frame
+            flip()  # Black frame
             _stim("blank")
 
             # --- Blank gap (silence, black screen) ---
             _phase(TrialPhase.TRAINING_BLANK, t.training_blank_duration)
-            for _ in range(self._n_blank - 1):
-                if self._abort:
-                    return False
-                self._win.flip()
+            if not hold(self._frames.blank - 1):
+                return False
 
         # ===== Optional delay between training and measurement =====
-        if self._n_train_to_meas_delay > 0:
-            if self._abort:
+        if self._frames.train_to_meas_delay > 0:
+            if abort.is_set():
                 return False
             _phase(TrialPhase.INTER_TRIAL, t.training_to_measurement_delay)
             _stim("blank")
-            for _ in range(self._n_train_to_meas_delay):
-                if self._abort:
-                    return False
-                self._win.flip()
+            if not hold(self._frames.train_to_meas_delay):
+                return False
 
         # ===== Instruction sequence: close your eyes =====
-        if self._abort:
+        if abort.is_set():
             return False
 
         _phase(TrialPhase.INSTRUCTION_CLOSE_EYES, 5.0)
         _stim("instruction:close_eyes")
         self._audio.play_instruction("close_your_eyes")
-        self._events.log("INSTRUCTION_CLOSE_EYES", subject, shape_name, str(rep))
+        log("INSTRUCTION_CLOSE_EYES", subject, shape_name, rep_str)
 
         # Wait 5 seconds (frame-counted)
         _phase(TrialPhase.INSTRUCTION_WAIT, 5.0)
-        for _ in range(self._n_close_eyes_wait):
-            if self._abort:
-                return False
-            self._win.flip()
+        if not hold(self._frames.close_eyes_wait):
+            return False
 
         # Play "starting" instruction
         _phase(TrialPhase.INSTRUCTION_STARTING, 2.0)
         _stim("instruction:starting")
         self._audio.play_instruction("starting")
-        self._events.log("INSTRUCTION_STARTING", subject, shape_name, str(rep))
+        log("INSTRUCTION_STARTING", subject, shape_name, rep_str)
 
         # Wait 2 seconds
         _phase(TrialPhase.INSTRUCTION_READY, 2.0)
-        for _ in range(self._n_starting_wait):
-            if self._abort:
-                return False
-            self._win.flip()
+        if not hold(self._frames.starting_wait):
+            return False
 
         # ===== Measurement phase (camera records from first beep to last beep offset) =====
-        if self._abort:
+        if abort.is_set():
             return False
 
         _stim("recording")
 
-        fps = (
-            self._camera._settings.target_frame_rate
-            if hasattr(self._camera, "_settings") and self._camera._settings
-            else 500.0
-        )
-
         # Start recording right before first beep
-        self._camera.start_recording(video_path, fps)
-        self._events.log(
-            "RECORDING_START", subject, shape_name, str(rep),
+        self._camera.start_recording(video_path, self._fps)
+        log(
+            "RECORDING_START", subject, shape_name, rep_str,
             str(video_path),
         )
 
         for i in range(t.measurement_repetitions):
-            if self._abort:
+            if abort.is_set():
                 self._camera.stop_recording()
                 return False
 
             # --- Beep start at vsync (screen stays black) ---
             _phase(TrialPhase.MEASUREMENT_BEEP, t.measurement_beep_duration)
-            self._win.call_on_flip(self._audio.play, "measurement")
-            self._win.call_on_flip(
-                self._events.log,
-                "MEASUREMENT_BEEP", subject, shape_name, str(rep),
-                f"beep_{i+1}",
+            start_on_flip(
+                "measurement",
+                "MEASUREMENT_BEEP", subject, shape_name, rep_str,
+                beep_tags[i],
             )
-            self._win.flip()
+            flip()
             _beep()
 
             # --- Sustain beep for remaining frames ---
-            for _ in range(self._n_beep - 1):
-                if self._abort:
-                    self._audio.stop("measurement")
-                    self._camera.stop_recording()
-                    return False
-                self._win.flip()
+            if not hold(self._frames.beep - 1):
+                self._audio.stop("measurement")
+                self._camera.stop_recording()
+                return False
 
             # --- Beep stop at vsync ---
-            self._win.call_on_flip(self._audio.stop, "measurement")
-            self._win.flip()
+            on_flip(self._audio.stop, "measurement")
+            flip()
 
             # --- Silence after every beep (including the last one,
             #     so recording continues for measurement_silence_duration) ---
             _phase(TrialPhase.MEASUREMENT_SILENCE, t.measurement_silence_duration)
-            for _ in range(self._n_silence - 1):
-                if self._abort:
-                    self._camera.stop_recording()
-                    return False
-                self._win.flip()
-
-        # Extra 1-second margin before stopping recording
-        for _ in range(self._n_recording_margin):
-            if self._abort:
+            if not hold(self._frames.silence - 1):
                 self._camera.stop_recording()
                 return False
-            self._win.flip()
+
+        # Extra 1-second margin before stopping recording
+        if not hold(self._frames.recording_margin):
+            self._camera.stop_recording()
+            return False
 
         # Stop recording after margin
         frames = self._camera.stop_recording()
-        self._events.log(
-            "RECORDING_STOP", subject, shape_name, str(rep),
+        # Draining the encoder can take hundreds of ms; re-anchor on a
+        # (still black) flip so the post-instruction wait starts from now
+        flip()
+        log(
+            "RECORDING_STOP", subject, shape_name, rep_str,
             f"frames={frames}",
         )
 
@@ -302,36 +480,28 @@ class TrialProtocol:
         # Use "experiment_completed" ONLY if this is truly the last item
         # in the entire session queue. Otherwise use "next_participant_please"
         # (even between reps of the same participant) or "open_your_eyes"
-        # (between shapes within a turn).
+        # (between shapes within a turn).  The recording is already saved,
+        # so an abort here just cuts the wait short — the trial still counts.
         _phase(TrialPhase.INSTRUCTION_POST, 5.0)
 
-        if not is_last_shape:
-            # More shapes remain for this subject's turn
-            _stim("instruction:open_your_eyes")
-            self._audio.play_instruction("open_your_eyes")
-            self._events.log("INSTRUCTION_OPEN_EYES", subject, shape_name, str(rep))
-            # Wait 5 seconds before next shape training begins
-            precise_sleep(5.0)
-        elif is_last_queue_item:
-            # Truly the last shape of the last queue item — session complete
-            _stim("instruction:experiment_completed")
-            self._audio.play_instruction("experiment_completed")
-            self._events.log("INSTRUCTION_COMPLETED", subject, shape_name, str(rep))
+        stim_state, instruction, event = _POST_MEASUREMENT[
+            (bool(is_last_shape), bool(is_last_queue_item))
+        ]
+        _stim(stim_state)
+        self._audio.play_instruction(instruction)
+        log(event, subject, shape_name, rep_str)
+        if instruction == "experiment_completed":
             # Wait for the full MP3 to finish (+ 1s buffer) so it doesn't
             # get cut off when PsychoPy closes
-            mp3_dur = self._audio.get_instruction_duration("experiment_completed")
-            precise_sleep(max(5.0, mp3_dur + 1.0))
+            mp3_dur = self._audio.get_instruction_duration(instruction)
+            hold(self._win.duration_to_frames(max(5.0, mp3_dur + 1.0)))
         else:
-            # Last shape of this turn, but more items remain (next participant
-            # or same participant's next repetition)
-            _stim("instruction:next_participant")
-            self._audio.play_instruction("next_participant_please")
-            self._events.log("INSTRUCTION_NEXT_PARTICIPANT", subject, shape_name, str(rep))
-            precise_sleep(5.0)
+            # 5 seconds before the next shape / participant begins
+            hold(self._frames.post_wait)
 
         _stim("idle")
-        self._events.log(
-            "TRIAL_END", subject, shape_name, str(rep),
+        log(
+            "TRIAL_END", subject, shape_name, rep_str,
             f"frames={frames}",
         )
         return True
@@ -4,9 +4,15 @@ from __future__ import annotations
 
 import json
 import logging
+import os
 from pathlib import Path
 from typing import Dict, List, Optional
 
+try:
+    import orjson  # optional — faster serialisation, stdlib json otherwise
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 # Store relative to the codebase root for portability
@@ -59,8 +65,17 @@ class AppMemory:
                 "last_audio_device": self.last_audio_device,
                 "last_screen_index": self.last_screen_index,
             }
-            with open(_MEMORY_FILE, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2)
+            if orjson is not None:
+                payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+            else:
+                payload = json.dumps(data, indent=2).encode("utf-8")
+            # Write-then-rename so a crash mid-save never truncates the file
+            tmp = _MEMORY_FILE.with_suffix(".json.tmp")
+            with open(tmp, "wb") as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, _MEMORY_FILE)
             logger.debug("App memory saved to %s", _MEMORY_FILE)
         except Exception as e:
             logger.warning("Failed to save app memory: %s", e)
@@ -78,9 +93,14 @@ class AppMemory:
         """Return all previously-used subject names."""
         return list(self.subject_history)
 
-    def update_settings(self, config_dict: dict) -> None:
-        """Store last-used experiment settings."""
+    def update_settings(self, config_dict: dict, output_folder: Optional[str] = None) -> None:
+        """Store last-used experiment settings (and output folder, if given).
+
+        Both are written in a single save.
+        """
         self.last_settings = config_dict
+        if output_folder is not None:
+            self.last_output_folder = output_folder
         self.save()
 
     def update_camera_settings(self, camera_dict: dict) -> None:
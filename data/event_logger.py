@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import csv
+import os
 import threading
 import time
 from pathlib import Path
@@ -14,6 +15,10 @@ class EventLogger:
 
     Each row: timestamp_s, elapsed_ms, event_type, subject, shape, rep, detail
 
+    Rows are buffered and written out every ``flush_every`` events or on
+    trial/session boundaries, so per-frame events (logged via callOnFlip)
+    never pay for a write syscall.  The file is fsynced on ``close()``.
+
     All public methods are thread-safe.
     """
 
@@ -22,11 +27,19 @@ class EventLogger:
         "subject", "shape", "rep", "detail",
     ]
 
-    def __init__(self, path: Path):
+    # Events after which buffered rows are pushed to the OS immediately
+    FLUSH_EVENTS = frozenset({
+        "SESSION_START", "RECORDING_STOP", "TRIAL_END",
+        "SESSION_COMPLETED", "SESSION_ABORTED", "SESSION_ERROR",
+    })
+
+    def __init__(self, path: Path, flush_every: int = 64):
         self._path = path
         self._lock = threading.Lock()
         self._start_time: Optional[float] = None
-        self._file = open(path, "w", newline="", encoding="utf-8")
+        self._flush_every = flush_every
+        self._pending = 0
+        self._file = open(path, "w", newline="", encoding="utf-8", buffering=8192)
         self._writer = csv.writer(self._file)
         self._writer.writerow(self.HEADER)
         self._file.flush()
@@ -56,8 +69,25 @@ class EventLogger:
                 rep,
                 detail,
             ])
+            self._pending += 1
+            if event_type in self.FLUSH_EVENTS or self._pending >= self._flush_every:
+                self._file.flush()
+                self._pending = 0
+
+    def flush(self) -> None:
+        """Write any buffered rows to the OS."""
+        with self._lock:
             self._file.flush()
+            self._pending = 0
 
     def close(self) -> None:
         with self._lock:
-            self._file.close()
+            if self._file.closed:
+                return
+            try:
+                self._file.flush()
+                os.fsync(self._file.fileno())
+            except OSError:
+                pass  # still close the handle; rows already flushed stay on disk
+            finally:
+                self._file.close()
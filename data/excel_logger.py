@@ -1,11 +1,12 @@
-"""Real-time Excel session log using openpyxl."""
+"""Session trial log: crash-safe CSV during the run, Excel at the end."""
 
 from __future__ import annotations
 
+import csv
 import threading
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
 
 class ExcelLogger:
@@ -13,8 +14,12 @@ class ExcelLogger:
 
     Columns: timestamp, subject, shape, rep, status, video_file, notes
 
-    All public methods are thread-safe. The workbook is saved after
-    every write to ensure data is not lost on crash.
+    Each row is appended to a sibling ``session_log.csv`` (flushed
+    immediately, so data is not lost on crash) and buffered in memory.
+    The workbook is written once with the header on creation and once
+    with all rows on ``close()``, instead of re-serialising it per row.
+
+    All public methods are thread-safe.
     """
 
     HEADER = [
@@ -25,9 +30,16 @@ class ExcelLogger:
     def __init__(self, path: Path):
         self._path = path
         self._lock = threading.Lock()
+        self._rows: List[list] = []
         self._wb: Optional[object] = None
         self._ws: Optional[object] = None
         self._init_workbook()
+        self._csv_file = open(
+            path.with_suffix(".csv"), "w", newline="", encoding="utf-8",
+        )
+        self._csv = csv.writer(self._csv_file)
+        self._csv.writerow(self.HEADER)
+        self._csv_file.flush()
 
     def _init_workbook(self) -> None:
         try:
@@ -55,19 +67,33 @@ class ExcelLogger:
         video_file: str = "",
         notes: str = "",
     ) -> None:
-        """Append a trial result row and save immediately."""
-        if self._ws is None:
-            return
+        """Append a trial result row (CSV is flushed; xlsx written on close)."""
+        row = [
+            datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            subject,
+            shape,
+            rep,
+            status,
+            video_file,
+            notes,
+        ]
+        with self._lock:
+            if self._csv_file.closed:
+                return
+            self._csv.writerow(row)
+            self._csv_file.flush()
+            self._rows.append(row)
+
+    def close(self) -> None:
+        """Write all buffered rows to the workbook and close the CSV."""
         with self._lock:
-            self._ws.append([
-                datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                subject,
-                shape,
-                rep,
-                status,
-                video_file,
-                notes,
-            ])
+            if self._csv_file.closed:
+                return
+            self._csv_file.close()
+            if self._ws is None or not self._rows:
+                return
+            for row in self._rows:
+                self._ws.append(row)
             self._wb.save(str(self._path))
 
     @property
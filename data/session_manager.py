@@ -17,6 +17,7 @@ class SessionManager:
 
         outputs/session_YYYY-MM-DD_HH-MM-SS/
             session_log.xlsx
+            session_log.csv
             session_config.json
             event_log.csv
             progress.json
@@ -5,7 +5,7 @@ from __future__ import annotations
 import logging
 from typing import Optional
 
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QThread
 from PyQt5.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
     QGroupBox, QMessageBox, QSplitter, QSizePolicy,
@@ -21,6 +21,31 @@ from gui.panels.camera_settings_panel import CameraSettingsPanel
 logger = logging.getLogger(__name__)
 
 
+class _ConnectWorker(QThread):
+    """Creates and connects the camera off the GUI thread.
+
+    Results are left on the worker (``camera``/``info`` or ``error``) for
+    the dialog to collect once ``finished`` fires.
+    """
+
+    def __init__(self, dev_mode: bool, settings: CameraSettings, parent=None):
+        super().__init__(parent)
+        self._dev_mode = dev_mode
+        self._settings = settings
+        self.camera: Optional[CameraBackend] = None
+        self.info: dict = {}
+        self.error = ""
+
+    def run(self) -> None:
+        try:
+            camera = create_camera(self._dev_mode)
+            camera.connect(self._settings)
+            self.info = camera.get_device_info()
+            self.camera = camera
+        except Exception as e:
+            self.error = str(e)
+
+
 class CameraSetupDialog(QDialog):
     """Wizard step 3: camera connection, preview, and settings.
 
@@ -49,6 +74,7 @@ class CameraSetupDialog(QDialog):
         self._memory = memory
         self._camera: Optional[CameraBackend] = None
         self._connected = False
+        self._connect_worker: Optional[_ConnectWorker] = None
         self._load_from_memory()
         self._build_ui()
         self._auto_connect()
@@ -59,6 +85,8 @@ class CameraSetupDialog(QDialog):
         # Status
         self._status_label = QLabel("Camera not connected")
         self._status_label.setAlignment(Qt.AlignCenter)
+        # Colour comes from the stylesheet; exception text can contain '<'
+        self._status_label.setTextFormat(Qt.PlainText)
         layout.addWidget(self._status_label)
 
         # Splitter: preview (top, resizable) | settings (bottom)
@@ -117,29 +145,50 @@ class CameraSetupDialog(QDialog):
                     setattr(cam, key, lcs[key])
 
     def _auto_connect(self) -> None:
-        """Attempt camera connection on dialog open."""
-        try:
-            self._camera = create_camera(self._dev_mode)
-            self._camera.connect(self._config.camera)
-            self._connected = True
-            info = self._camera.get_device_info()
-            model = info.get("model", "Unknown")
-            self._status_label.setText(
-                f'<span style="color:green;">Connected: {model}</span>'
-            )
-            self._preview.set_camera(self._camera)
-            self._preview.start_preview()
-        except Exception as e:
-            self._status_label.setText(
-                f'<span style="color:red;">Connection failed: {e}</span>'
-            )
-            logger.warning("Camera auto-connect failed: %s", e)
+        """Start connecting the camera in the background.
+
+        Opening a camera can take a couple of seconds; doing it on a
+        worker thread keeps the dialog responsive meanwhile.
+        """
+        if self._connect_worker is not None:
+            return  # already connecting
+        self._status_label.setStyleSheet("")
+        self._status_label.setText("Connecting to camera...")
+        worker = _ConnectWorker(self._dev_mode, self._config.camera, self)
+        worker.finished.connect(self._on_connect_finished)
+        self._connect_worker = worker
+        worker.start()
+
+    def _on_connect_finished(self) -> None:
+        """Adopt the camera opened by the connect worker (or show why not)."""
+        worker = self._connect_worker
+        if worker is None:
+            return  # already collected by _on_confirm / reject
+        self._connect_worker = None
+        worker.deleteLater()
+        if worker.camera is None:
+            self._set_status(f"Connection failed: {worker.error}", "red")
+            logger.warning("Camera auto-connect failed: %s", worker.error)
+            return
+        self._camera = worker.camera
+        self._connected = True
+        model = worker.info.get("model", "Unknown")
+        self._set_status(f"Connected: {model}", "green")
+        self._preview.set_camera(self._camera)
+        self._preview.start_preview()
+
+    def _set_status(self, text: str, color: str) -> None:
+        self._status_label.setStyleSheet(f"color: {color};")
+        self._status_label.setText(text)
 
     def _reconnect(self) -> None:
         """Disconnect and reconnect with current settings."""
+        if self._connect_worker is not None:
+            return  # a connection attempt is still in progress
         self._preview.stop_preview()
         if self._camera:
             self._camera.disconnect()
+        self._connected = False
         self._config.camera = self._settings_panel.apply_to_settings(self._config.camera)
         self._auto_connect()
 
@@ -147,10 +196,16 @@ class CameraSetupDialog(QDialog):
         """Apply settings to the camera live when sliders change."""
         if self._camera and self._connected:
             new_settings = self._settings_panel.apply_to_settings(self._config.camera)
+            if new_settings == self._config.camera:
+                return  # nothing changed; don't reconfigure the camera
             self._camera.update_settings(new_settings)
             self._config.camera = new_settings
 
     def _on_confirm(self) -> None:
+        if self._connect_worker is not None:
+            # Let a pending connection finish rather than leak it
+            self._connect_worker.wait()
+            self._on_connect_finished()
         if not self._connected:
             result = QMessageBox.question(
                 self, "No Camera",
@@ -174,6 +229,12 @@ class CameraSetupDialog(QDialog):
         super().closeEvent(event)
 
     def reject(self) -> None:
+        worker = self._connect_worker
+        if worker is not None:
+            self._connect_worker = None
+            worker.wait()
+            if worker.camera is not None:
+                worker.camera.disconnect()
         self._preview.stop_preview()
         if self._camera:
             self._camera.disconnect()
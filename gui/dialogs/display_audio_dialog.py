@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import logging
 
 from PyQt5.QtCore import Qt
@@ -14,6 +15,25 @@ from data.app_memory import AppMemory
 
 logger = logging.getLogger(__name__)
 
+_FLASH_DURATION_S = 0.8
+_TEST_TONE_SR = 44100
+
+
+@functools.lru_cache(maxsize=1)
+def _test_tone():
+    """500 ms 440 Hz float32 sine with a short fade-out, built on first use."""
+    import numpy as np
+
+    duration = 0.5
+    samples = int(_TEST_TONE_SR * duration)
+    t = np.linspace(0, duration, samples, False)
+    tone = (0.6 * np.sin(2 * np.pi * 440 * t)).astype(np.float32)
+    # Apply a short fade-out (last 10% of samples) to avoid clicks
+    fade_len = samples // 10
+    tone[-fade_len:] *= np.linspace(1.0, 0.0, fade_len, dtype=np.float32)
+    tone.flags.writeable = False  # shared by every click
+    return tone
+
 
 class DisplayAudioDialog(QDialog):
     """Wizard step 4: select display screen and audio output device."""
@@ -37,17 +57,19 @@ class DisplayAudioDialog(QDialog):
         self._screen_combo = QComboBox()
         app = QApplication.instance()
         screens = app.screens()
+        primary_screen = app.primaryScreen()
         for i, screen in enumerate(screens):
             geo = screen.geometry()
-            primary = " (Primary)" if screen == app.primaryScreen() else ""
+            primary = " (Primary)" if screen == primary_screen else ""
             self._screen_combo.addItem(
                 f"Screen {i + 1}: {screen.name()} "
                 f"({geo.width()}x{geo.height()}){primary}",
                 i,
             )
         # Default to last screen (likely secondary) or saved preference
-        if self._memory.last_screen_index >= 0 and self._memory.last_screen_index < len(screens):
-            self._screen_combo.setCurrentIndex(self._memory.last_screen_index)
+        last_screen = self._memory.last_screen_index
+        if 0 <= last_screen < len(screens):
+            self._screen_combo.setCurrentIndex(last_screen)
         elif len(screens) > 1:
             self._screen_combo.setCurrentIndex(len(screens) - 1)
 
@@ -134,7 +156,7 @@ class DisplayAudioDialog(QDialog):
                         self._flash_widget.close()
                         self._flash_widget = None
 
-                QTimer.singleShot(800, _close_flash)
+                QTimer.singleShot(int(_FLASH_DURATION_S * 1000), _close_flash)
         except Exception as e:
             logger.warning("Screen test failed: %s", e)
 
@@ -151,26 +173,12 @@ class DisplayAudioDialog(QDialog):
         def _play():
             try:
                 import sounddevice as sd
-                import numpy as np
-
-                # Find device index by name
-                device_idx = None
-                if device_name:
-                    for i, d in enumerate(sd.query_devices()):
-                        if d['name'] == device_name and d['max_output_channels'] > 0:
-                            device_idx = i
-                            break
-
-                # Generate 500ms 440Hz sine tone with a short fade-out
-                sr = 44100
-                duration = 0.5
-                samples = int(sr * duration)
-                t = np.linspace(0, duration, samples, False)
-                tone = (0.6 * np.sin(2 * np.pi * 440 * t)).astype(np.float32)
-                # Apply a short fade-out (last 10% of samples) to avoid clicks
-                fade_len = samples // 10
-                tone[-fade_len:] *= np.linspace(1.0, 0.0, fade_len, dtype=np.float32)
-                sd.play(tone, sr, device=device_idx)
+                from audio import audio_device_index
+
+                # Index from the enumeration that filled the combo box
+                device_idx = audio_device_index(device_name) if device_name else None
+
+                sd.play(_test_tone(), _TEST_TONE_SR, device=device_idx)
                 sd.wait()
             except Exception as e:
                 logger.warning("Speaker test failed: %s", e)
@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
 from typing import Optional, List
 
-from PyQt5.QtCore import Qt
-from PyQt5.QtGui import QColor
+from PyQt5.QtCore import (
+    Qt, QObject, QRunnable, QSize, QThreadPool, pyqtSignal, pyqtSlot,
+)
+from PyQt5.QtGui import QColor, QIcon, QImage, QPixmap
 from PyQt5.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QFormLayout, QGroupBox,
     QSpinBox, QDoubleSpinBox, QCheckBox, QPushButton, QLabel,
@@ -19,23 +22,72 @@ from config.settings import ExperimentConfig
 from data.app_memory import AppMemory
 
 
+# Applied once to the dialog; every '?' button picks it up by object name
+_TOOLTIP_QSS = (
+    "QToolButton#tipBtn { font-size: 11px; font-weight: bold; "
+    "border: 1px solid #666; border-radius: 11px; "
+    "background-color: #e0e0e0; color: #333; }"
+)
+
+
+class _TipButton(QToolButton):
+    """Small '?' button that shows its tooltip in an info popup on click."""
+
+    def __init__(self, tooltip: str):
+        super().__init__()
+        self.setObjectName("tipBtn")  # styled by _TOOLTIP_QSS on the dialog
+        self.setText("?")
+        self.setFixedSize(22, 22)
+        self.setToolTip(tooltip)
+        self.setCursor(Qt.PointingHandCursor)
+        self.clicked.connect(self._show_tip)
+
+    @pyqtSlot()
+    def _show_tip(self) -> None:
+        # One popup per dialog, created on first use and reused after
+        window = self.window()
+        box = window.findChild(QMessageBox, "tipBox", Qt.FindDirectChildrenOnly)
+        if box is None:
+            box = QMessageBox(
+                QMessageBox.Information, "Info", "", QMessageBox.Ok, window,
+            )
+            box.setObjectName("tipBox")
+        box.setText(self.toolTip())
+        box.exec_()
+
+
+# Edge length of the image-list thumbnails (list is only 100 px tall)
+_THUMB_SIZE = 32
+
+
+class _ThumbnailJob(QRunnable):
+    """Decodes and downscales one image on the global thread pool.
+
+    QImage (unlike QPixmap) is safe to use off the GUI thread; the result
+    is handed back through ``ready`` and turned into an icon there.
+    """
+
+    class _Signals(QObject):
+        ready = pyqtSignal(str, QImage)
+
+    def __init__(self, path: str, on_ready):
+        super().__init__()
+        self._path = path
+        self.signals = self._Signals()
+        self.signals.ready.connect(on_ready)
+
+    def run(self) -> None:
+        image = QImage(self._path)
+        if not image.isNull():
+            image = image.scaled(
+                _THUMB_SIZE, _THUMB_SIZE, Qt.KeepAspectRatio, Qt.FastTransformation,
+            )
+        self.signals.ready.emit(self._path, image)
+
+
 def _tooltip_btn(tooltip: str) -> QToolButton:
     """Create a small '?' button that shows an info popup on click."""
-    btn = QToolButton()
-    btn.setText("?")
-    btn.setFixedSize(22, 22)
-    btn.setToolTip(tooltip)
-    btn.setStyleSheet(
-        "font-size: 11px; font-weight: bold; "
-        "border: 1px solid #666; border-radius: 11px; "
-        "background-color: #e0e0e0; color: #333;"
-    )
-    btn.setCursor(Qt.PointingHandCursor)
-    # Show a popup dialog on click
-    btn.clicked.connect(lambda checked, msg=tooltip: QMessageBox.information(
-        btn.window(), "Info", msg,
-    ))
-    return btn
+    return _TipButton(tooltip)
 
 
 def _row_with_tooltip(widget, tooltip: str):
@@ -62,10 +114,14 @@ class ExperimentSettingsDialog(QDialog):
         self._shape_checks: dict[str, QCheckBox] = {}
         self._selected_color = QColor(config.stimulus.color_hex)
         self._image_paths: List[str] = list(config.stimulus.image_paths)
+        self._image_names: dict[str, str] = {}  # path -> display name
+        self._thumbs: dict[str, QIcon] = {}      # path -> decoded thumbnail
+        self._thumbs_pending: set[str] = set()
         self._build_ui()
         self._load_from_memory()
 
     def _build_ui(self) -> None:
+        self.setStyleSheet(_TOOLTIP_QSS)
         outer = QVBoxLayout()
 
         # Scrollable content
@@ -133,8 +189,9 @@ class ExperimentSettingsDialog(QDialog):
 
         self._image_list = QListWidget()
         self._image_list.setMaximumHeight(100)
-        for path in self._image_paths:
-            self._image_list.addItem(Path(path).name)
+        self._image_list.setIconSize(QSize(_THUMB_SIZE, _THUMB_SIZE))
+        self._image_list.addItems([self._name_of(p) for p in self._image_paths])
+        self._load_thumbnails(self._image_paths)
         images_inner.addWidget(self._image_list)
 
         img_btn_row = QHBoxLayout()
@@ -241,6 +298,21 @@ class ExperimentSettingsDialog(QDialog):
 
         layout.addLayout(form)
 
+        # Config field -> spin box, for apply_to_config / _load_from_memory
+        self._rep_widgets = (
+            ("repetitions", self._reps),
+            ("shape_reps_per_subsession", self._shape_reps),
+        )
+        self._timing_widgets = (
+            ("training_shape_duration", self._train_shape_dur),
+            ("training_blank_duration", self._train_blank_dur),
+            ("training_repetitions", self._train_reps),
+            ("training_to_measurement_delay", self._train_to_meas_delay),
+            ("measurement_beep_duration", self._meas_beep_dur),
+            ("measurement_silence_duration", self._meas_silence_dur),
+            ("measurement_repetitions", self._meas_reps),
+        )
+
         # Output folder
         folder_group = QGroupBox("Output Folder")
         folder_layout = QHBoxLayout()
@@ -298,15 +370,50 @@ class ExperimentSettingsDialog(QDialog):
             self._selected_color = color
             self._update_color_preview()
 
+    def _name_of(self, path: str) -> str:
+        """Display name (file name) for an image path, cached per path."""
+        name = self._image_names.get(path)
+        if name is None:
+            name = self._image_names[path] = os.path.basename(path)
+        return name
+
     def _add_image(self) -> None:
         paths, _ = QFileDialog.getOpenFileNames(
             self, "Select Stimulus Image(s)", "",
             "Images (*.png *.jpg *.jpeg *.bmp *.gif *.tiff *.tif)"
         )
+        known = set(self._image_paths)
+        new_paths = []
+        for p in paths:
+            if p not in known:
+                known.add(p)
+                new_paths.append(p)
+        self._image_paths.extend(new_paths)
+        self._image_list.addItems([self._name_of(p) for p in new_paths])
+        self._load_thumbnails(new_paths)
+
+    def _load_thumbnails(self, paths: List[str]) -> None:
+        """Show cached thumbnails now; decode the rest on the thread pool."""
+        pool = QThreadPool.globalInstance()
         for p in paths:
-            if p not in self._image_paths:
-                self._image_paths.append(p)
-                self._image_list.addItem(Path(p).name)
+            if p in self._thumbs:
+                self._set_thumbnail(p, self._thumbs[p])
+            elif p not in self._thumbs_pending:
+                self._thumbs_pending.add(p)
+                pool.start(_ThumbnailJob(p, self._on_thumbnail_ready))
+
+    @pyqtSlot(str, QImage)
+    def _on_thumbnail_ready(self, path: str, image: QImage) -> None:
+        self._thumbs_pending.discard(path)
+        if image.isNull():
+            return  # unreadable file — the name alone is shown
+        icon = self._thumbs[path] = QIcon(QPixmap.fromImage(image))
+        self._set_thumbnail(path, icon)
+
+    def _set_thumbnail(self, path: str, icon: QIcon) -> None:
+        for row, p in enumerate(self._image_paths):
+            if p == path:
+                self._image_list.item(row).setIcon(icon)
 
     def _remove_image(self) -> None:
         row = self._image_list.currentRow()
@@ -321,42 +428,33 @@ class ExperimentSettingsDialog(QDialog):
         if self._memory.last_settings:
             ls = self._memory.last_settings
             # Shapes
-            if "shapes" in ls:
+            shapes = ls.get("shapes")
+            if shapes is not None:
                 for name, cb in self._shape_checks.items():
-                    cb.setChecked(name in ls["shapes"])
-            # Repetitions
-            if "repetitions" in ls:
-                self._reps.setValue(ls["repetitions"])
-            if "shape_reps_per_subsession" in ls:
-                self._shape_reps.setValue(ls["shape_reps_per_subsession"])
-            # Timing
-            timing = ls.get("timing", {})
-            if "training_shape_duration" in timing:
-                self._train_shape_dur.setValue(timing["training_shape_duration"])
-            if "training_blank_duration" in timing:
-                self._train_blank_dur.setValue(timing["training_blank_duration"])
-            if "training_repetitions" in timing:
-                self._train_reps.setValue(timing["training_repetitions"])
-            if "training_to_measurement_delay" in timing:
-                self._train_to_meas_delay.setValue(timing["training_to_measurement_delay"])
-            if "measurement_beep_duration" in timing:
-                self._meas_beep_dur.setValue(timing["measurement_beep_duration"])
-            if "measurement_silence_duration" in timing:
-                self._meas_silence_dur.setValue(timing["measurement_silence_duration"])
-            if "measurement_repetitions" in timing:
-                self._meas_reps.setValue(timing["measurement_repetitions"])
+                    cb.setChecked(name in shapes)
+            # Repetitions, then timing
+            for section, widgets in (
+                (ls, self._rep_widgets),
+                (ls.get("timing", {}), self._timing_widgets),
+            ):
+                for key, widget in widgets:
+                    value = section.get(key)
+                    if value is not None:
+                        widget.setValue(value)
             # Stimulus settings
             stim = ls.get("stimulus", {})
-            if "color_hex" in stim:
-                self._selected_color = QColor(stim["color_hex"])
+            color_hex = stim.get("color_hex")
+            if color_hex is not None:
+                self._selected_color = QColor(color_hex)
                 self._update_color_preview()
-            if "use_images" in stim and stim["use_images"]:
+            if stim.get("use_images"):
                 self._radio_images.setChecked(True)
-            if "image_paths" in stim and stim["image_paths"]:
-                self._image_paths = list(stim["image_paths"])
+            image_paths = stim.get("image_paths")
+            if image_paths:
+                self._image_paths = list(image_paths)
                 self._image_list.clear()
-                for p in self._image_paths:
-                    self._image_list.addItem(Path(p).name)
+                self._image_list.addItems([self._name_of(p) for p in self._image_paths])
+                self._load_thumbnails(self._image_paths)
 
     def _browse_folder(self) -> None:
         folder = QFileDialog.getExistingDirectory(
@@ -441,11 +539,18 @@ class ExperimentSettingsDialog(QDialog):
         self.apply_to_config(self._config)
         defaults_path = Path(__file__).resolve().parent.parent.parent / "config" / "defaults.json"
         self._config.save(defaults_path)
-        self._memory.update_settings(self._config.to_dict())
-        self._memory.last_output_folder = self._config.output_base_dir
-        self._memory.save()
+        self._remember_settings()
         QMessageBox.information(self, "Saved", "Defaults saved successfully.")
 
+    def _remember_settings(self) -> None:
+        """Store the config in app memory, skipping the write if nothing changed."""
+        config_dict = self._config.to_dict()
+        folder = self._config.output_base_dir
+        memory = self._memory
+        if memory.last_settings == config_dict and memory.last_output_folder == folder:
+            return
+        memory.update_settings(config_dict, folder)
+
     def _on_next(self) -> None:
         self.apply_to_config(self._config)
         errors = self._config.validate()
@@ -453,9 +558,7 @@ class ExperimentSettingsDialog(QDialog):
             QMessageBox.warning(self, "Validation Error", "\n".join(errors))
             return
         # Persist all settings for next session
-        self._memory.update_settings(self._config.to_dict())
-        self._memory.last_output_folder = self._config.output_base_dir
-        self._memory.save()
+        self._remember_settings()
         self.accept()
 
     def apply_to_config(self, config: ExperimentConfig) -> None:
@@ -463,15 +566,11 @@ class ExperimentSettingsDialog(QDialog):
         config.shapes = [
             name for name, cb in self._shape_checks.items() if cb.isChecked()
         ]
-        config.repetitions = self._reps.value()
-        config.shape_reps_per_subsession = self._shape_reps.value()
-        config.timing.training_shape_duration = self._train_shape_dur.value()
-        config.timing.training_blank_duration = self._train_blank_dur.value()
-        config.timing.training_repetitions = self._train_reps.value()
-        config.timing.training_to_measurement_delay = self._train_to_meas_delay.value()
-        config.timing.measurement_beep_duration = self._meas_beep_dur.value()
-        config.timing.measurement_silence_duration = self._meas_silence_dur.value()
-        config.timing.measurement_repetitions = self._meas_reps.value()
+        for key, widget in self._rep_widgets:
+            setattr(config, key, widget.value())
+        timing = config.timing
+        for key, widget in self._timing_widgets:
+            setattr(timing, key, widget.value())
         config.output_base_dir = self._folder_edit.text()
 
         # Stimulus settings
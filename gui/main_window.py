@@ -2,10 +2,15 @@
 
 from __future__ import annotations
 
+import importlib
 import logging
+import statistics
+import threading
+import time
+from collections import deque
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 from PyQt5.QtCore import Qt, QTimer
 from PyQt5.QtWidgets import (
@@ -15,9 +20,6 @@ from PyQt5.QtWidgets import (
 
 from config.settings import ExperimentConfig
 from core.enums import ExperimentState, TrialPhase
-from core.experiment_engine import ExperimentEngine
-from hardware.camera_factory import create_camera
-from hardware.camera_base import CameraBackend
 from data.app_memory import AppMemory
 
 from gui.panels.camera_preview_panel import CameraPreviewPanel
@@ -26,8 +28,35 @@ from gui.panels.progress_panel import ProgressPanel
 from gui.panels.control_panel import ControlPanel
 from gui.panels.stimulus_mirror_panel import StimulusMirrorPanel
 
+if TYPE_CHECKING:
+    # Imported in _on_start: the engine pulls in the loggers (openpyxl)
+    # and is preloaded by main.py while the wizard runs
+    from core.experiment_engine import ExperimentEngine
+    from hardware.camera_base import CameraBackend
+
 logger = logging.getLogger(__name__)
 
+# End-time estimate: median over this many measured queue items, ignoring
+# items that took less than _MIN_ITEM_SAMPLE_SEC
+_ITEM_TIME_WINDOW = 5
+_MIN_ITEM_SAMPLE_SEC = 1.0
+
+
+def _preload_during_dialog(module: str) -> None:
+    """Import the next wizard step's module once the current dialog is up.
+
+    The zero-delay timer fires inside the modal dialog's event loop, so
+    the import runs while the operator is still filling in the current
+    step instead of after they click Next.
+    """
+    def _load() -> None:
+        try:
+            importlib.import_module(module)
+        except Exception:
+            pass  # the wizard's own import reports the real error
+
+    QTimer.singleShot(0, _load)
+
 
 class MainWindow(QMainWindow):
     """Top-level experiment GUI window.
@@ -52,7 +81,14 @@ class MainWindow(QMainWindow):
 
         # End-time estimation state
         self._end_time_timer: Optional[QTimer] = None
-        self._remaining_sec: float = 0.0
+        self._end_clock_running = False
+        self._end_time_shown: Optional[tuple] = None  # last (end h, end m, remaining min)
+        self._remaining_sec: float = 0.0      # estimate as of the last anchor
+        self._end_deadline: float = 0.0       # time.monotonic() of expected end
+        self._expected_end: Optional[datetime] = None
+        # Measured durations of the most recent queue items (see _record_item_time)
+        self._recent_item_secs: deque = deque(maxlen=_ITEM_TIME_WINDOW)
+        self._last_advance_time: Optional[float] = None
         self._per_item_sec: float = 0.0
         self._experiment_started = False
         self._last_queue_index = 0
@@ -73,6 +109,7 @@ class MainWindow(QMainWindow):
         # Step 1: Mode selection
         from gui.dialogs.mode_selector_dialog import ModeSelectorDialog
         mode_dlg = ModeSelectorDialog(self)
+        _preload_during_dialog("gui.dialogs.subject_dialog")
         if mode_dlg.exec_() != ModeSelectorDialog.Accepted:
             self.close()
             return
@@ -82,6 +119,7 @@ class MainWindow(QMainWindow):
         # Step 2: Subjects
         from gui.dialogs.subject_dialog import SubjectDialog
         subject_dlg = SubjectDialog(self._memory, self)
+        _preload_during_dialog("gui.dialogs.experiment_settings_dialog")
         if subject_dlg.exec_() != SubjectDialog.Accepted:
             self.close()
             return
@@ -93,6 +131,7 @@ class MainWindow(QMainWindow):
             self.config, self._memory, self,
             n_subjects=len(self._subjects),
         )
+        _preload_during_dialog("gui.dialogs.camera_setup_dialog")
         if settings_dlg.exec_() != ExperimentSettingsDialog.Accepted:
             self.close()
             return
@@ -100,6 +139,7 @@ class MainWindow(QMainWindow):
         # Step 4: Camera setup
         from gui.dialogs.camera_setup_dialog import CameraSetupDialog
         camera_dlg = CameraSetupDialog(self.config, self._dev_mode, self._memory, self)
+        _preload_during_dialog("gui.dialogs.display_audio_dialog")
         if camera_dlg.exec_() != CameraSetupDialog.Accepted:
             self.close()
             return
@@ -183,24 +223,17 @@ class MainWindow(QMainWindow):
 
     # --- Duration estimation ---
 
+    # Fixed part of a trial: instructions (close-eyes MP3 ~2 s + 5 s wait,
+    # "starting" MP3 ~1 s + 2 s), 1 s recording margin, and the post MP3
+    # (~2 s) + 5 s wait
+    _TRIAL_OVERHEAD_SEC = (2.0 + 5.0 + 1.0 + 2.0) + 1.0 + (2.0 + 5.0)
+
     def _estimate_per_trial_sec(self) -> float:
         """Estimate duration of a single shape trial in seconds."""
         t = self.config.timing
-        mp3_close = 2.0   # estimated MP3 durations
-        mp3_starting = 1.0
-        mp3_post = 2.0
-
-        training = t.training_repetitions * (
-            t.training_shape_duration + t.training_blank_duration
-        )
-        instruction = mp3_close + 5.0 + mp3_starting + 2.0
-        measurement = t.measurement_repetitions * (
-            t.measurement_beep_duration + t.measurement_silence_duration
-        ) + 1.0  # recording margin
-        post = mp3_post + 5.0
-
-        return (training + t.training_to_measurement_delay
-                + instruction + measurement + post)
+        # Phase sums are kept precomputed by TimingSettings
+        return (t.training_phase_duration + t.training_to_measurement_delay
+                + t.measurement_phase_duration + self._TRIAL_OVERHEAD_SEC)
 
     def _init_end_time_tracking(self) -> None:
         """Compute estimated duration and prepare the end-time clock."""
@@ -219,6 +252,8 @@ class MainWindow(QMainWindow):
         self._remaining_sec = q.total * self._per_item_sec
         self._experiment_started = False
         self._last_queue_index = 0
+        self._last_advance_time = None
+        self._recent_item_secs.clear()
 
         # Show initial estimate as "duration" note
         total_min = int(self._remaining_sec // 60)
@@ -228,35 +263,76 @@ class MainWindow(QMainWindow):
         )
 
     def _start_end_time_clock(self) -> None:
-        """Start the 1-second timer that updates the end-time display."""
+        """Start keeping the end-time display current."""
         self._experiment_started = True
+        self._end_clock_running = True
         if self._end_time_timer is None:
             self._end_time_timer = QTimer(self)
+            self._end_time_timer.setSingleShot(True)
             self._end_time_timer.timeout.connect(self._update_end_time_display)
-        self._end_time_timer.start(1000)
+        self._last_advance_time = time.monotonic()
+        self._anchor_end_time()
         self._update_end_time_display()
 
+    def _anchor_end_time(self) -> None:
+        """Fix the expected end from the current remaining estimate.
+
+        Called when the clock starts and on every queue advance; between
+        those the end time is a constant and only the countdown moves.
+        """
+        self._end_deadline = time.monotonic() + self._remaining_sec
+        self._expected_end = datetime.now() + timedelta(seconds=self._remaining_sec)
+
     def _update_end_time_display(self) -> None:
-        """Recalculate and display expected end time."""
-        if self._remaining_sec <= 0:
-            self.queue_panel.end_time_panel.set_time(0, 0)
-            self.queue_panel.end_time_panel.set_note("Should be done!")
+        """Display the expected end time and the time remaining until it.
+
+        Called on queue advances and, while the clock runs, again each
+        time the remaining minutes tick over.
+        """
+        panel = self.queue_panel.end_time_panel
+        remaining = self._end_deadline - time.monotonic()
+        if remaining <= 0:
+            if self._end_time_shown != ():
+                self._end_time_shown = ()
+                panel.set_time(0, 0)
+                panel.set_note("Should be done!")
             return
 
-        expected_end = datetime.now() + timedelta(seconds=self._remaining_sec)
-        self.queue_panel.end_time_panel.set_time(
-            expected_end.hour, expected_end.minute,
-        )
-
-        # Show remaining as note
-        rem_min = int(self._remaining_sec // 60)
-        h, m = divmod(rem_min, 60)
-        self.queue_panel.end_time_panel.set_note(
-            f"~{h:02d}:{m:02d} remaining"
-        )
+        end = self._expected_end
+        rem_min = int(remaining // 60)
+        shown = (end.hour, end.minute, rem_min)
+        if shown != self._end_time_shown:
+            self._end_time_shown = shown
+            panel.set_time(end.hour, end.minute)
+            # Show remaining as note
+            h, m = divmod(rem_min, 60)
+            panel.set_note(f"~{h:02d}:{m:02d} remaining")
+
+        if self._end_clock_running:
+            # Wake again just after the remaining minutes change
+            self._end_time_timer.start(int((remaining % 60) * 1000) + 1)
+
+    def _record_item_time(self, items_completed: int) -> None:
+        """Fold the measured time of the items just completed into
+        ``_per_item_sec``.
+
+        Once two samples exist, the estimate becomes the median of the
+        last few measured items: real items include operator confirm
+        time that the static estimate knows nothing about.  Implausibly
+        short samples (items skipped in well under a second) are ignored.
+        """
+        now = time.monotonic()
+        if self._last_advance_time is not None:
+            per_item = (now - self._last_advance_time) / items_completed
+            if per_item >= _MIN_ITEM_SAMPLE_SEC:
+                self._recent_item_secs.append(per_item)
+            if len(self._recent_item_secs) >= 2:
+                self._per_item_sec = statistics.median(self._recent_item_secs)
+        self._last_advance_time = now
 
     def _stop_end_time_clock(self) -> None:
         """Stop the end-time update timer."""
+        self._end_clock_running = False
         if self._end_time_timer:
             self._end_time_timer.stop()
 
@@ -272,8 +348,11 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "Invalid Config", "\n".join(errors))
             return
 
+        from core.experiment_engine import ExperimentEngine
+
         # Create camera if not already connected
         if self.camera is None or not self.camera.is_connected():
+            from hardware.camera_factory import create_camera
             self.camera = create_camera(self._dev_mode)
             try:
                 self.camera.connect(self.config.camera)
@@ -296,17 +375,21 @@ class MainWindow(QMainWindow):
         # Initialize end-time estimation
         self._init_end_time_tracking()
 
-        # Connect engine worker signals
+        # Connect engine worker signals.  They are always emitted from the
+        # engine thread, so the queued connection is stated up front
         worker = self.engine.start()
-        worker.state_changed.connect(self._on_state_changed)
-        worker.phase_changed.connect(self._on_phase_changed)
-        worker.queue_advanced.connect(self._on_queue_advanced)
-        worker.trial_completed.connect(self._on_trial_completed)
-        worker.progress_text.connect(self._on_progress_text)
-        worker.error_occurred.connect(self._on_error)
-        worker.session_finished.connect(self._on_session_finished)
-        worker.stimulus_update.connect(self._on_stimulus_update)
-        worker.beep_progress.connect(self._on_beep_progress)
+        for signal, slot in (
+            (worker.state_changed, self._on_state_changed),
+            (worker.phase_changed, self._on_phase_changed),
+            (worker.queue_advanced, self._on_queue_advanced),
+            (worker.trial_completed, self._on_trial_completed),
+            (worker.progress_text, self._on_progress_text),
+            (worker.error_occurred, self._on_error),
+            (worker.session_finished, self._on_session_finished),
+            (worker.stimulus_update, self._on_stimulus_update),
+            (worker.beep_progress, self._on_beep_progress),
+        ):
+            signal.connect(slot, Qt.QueuedConnection)
 
         self.control_panel.set_preparing()
         self.progress_panel.set_status("Please wait.. preparing the experiment...")
@@ -361,12 +444,14 @@ class MainWindow(QMainWindow):
             q = self.engine.queue
             self.progress_panel.set_overall_progress(index, q.total)
 
-        # Subtract completed item's estimated duration from remaining
         items_completed = index - self._last_queue_index
         if items_completed > 0:
-            self._remaining_sec -= items_completed * self._per_item_sec
-            self._remaining_sec = max(0.0, self._remaining_sec)
+            self._record_item_time(items_completed)
+            # Items still to run, at the (possibly re-measured) per-item time
+            total = self.engine.queue.total if self.engine and self.engine.queue else index
+            self._remaining_sec = max(0, total - index) * self._per_item_sec
             self._last_queue_index = index
+            self._anchor_end_time()
             self._update_end_time_display()
 
     def _on_trial_completed(
@@ -410,16 +495,28 @@ class MainWindow(QMainWindow):
         logger.info("Shutting down application")
         self._stop_end_time_clock()
         self.camera_preview.stop_preview()
-        if self.camera and self.camera.is_connected():
-            self.camera.disconnect()
-        self.camera = None
+        self._disconnect_camera()
         self.engine = None
         QApplication.quit()
 
+    def _disconnect_camera(self) -> None:
+        """Release the camera without blocking the GUI thread.
+
+        Closing a Basler device can take seconds.  The thread is not a
+        daemon, so the process still waits for the disconnect to finish
+        before exiting — the window just doesn't freeze meanwhile.
+        """
+        camera, self.camera = self.camera, None
+        if camera and camera.is_connected():
+            threading.Thread(
+                target=camera.disconnect, name="camera-disconnect",
+            ).start()
+
     def closeEvent(self, event) -> None:
         """Ensure cleanup on window close."""
+        self._stop_end_time_clock()
         if self.engine and self.engine.state == ExperimentState.RUNNING:
             self.engine.request_abort()
-        if self.camera and self.camera.is_connected():
-            self.camera.disconnect()
+        self.camera_preview.stop_preview()
+        self._disconnect_camera()
         super().closeEvent(event)
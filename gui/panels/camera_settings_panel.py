@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from PyQt5.QtCore import Qt, pyqtSignal
+from dataclasses import replace
+
+from PyQt5.QtCore import Qt, QTimer, pyqtSignal, pyqtSlot
 from PyQt5.QtWidgets import (
     QGroupBox, QFormLayout, QSpinBox, QDoubleSpinBox, QComboBox,
     QLabel, QSlider, QHBoxLayout, QWidget,
@@ -11,6 +13,16 @@ from PyQt5.QtWidgets import (
 from config.settings import CameraSettings
 
 
+# Quiet period before a burst of slider releases is applied to the camera
+_APPLY_DEBOUNCE_MS = 150
+
+# Offset value labels are refreshed at most this often (~30 Hz) while dragging
+_LABEL_REFRESH_MS = 33
+
+# Offset label text for every slider step (each step = 4 pixels, max 1440)
+_OFFSET_TEXT = tuple(str(v * 4) for v in range(1440 // 4 + 1))
+
+
 class CameraSettingsPanel(QGroupBox):
     """Editable camera parameter controls."""
 
@@ -20,6 +32,17 @@ class CameraSettingsPanel(QGroupBox):
         super().__init__("Camera Settings", parent)
         self._settings = settings
         self._dev_mode = dev_mode
+        # Last result of apply_to_settings
+        self._applied: CameraSettings | None = None
+        # settings_changed is emitted from here, once a burst of edits settles
+        self._apply_timer = QTimer(self)
+        self._apply_timer.setSingleShot(True)
+        self._apply_timer.setInterval(_APPLY_DEBOUNCE_MS)
+        self._apply_timer.timeout.connect(self.settings_changed)
+        self._label_timer = QTimer(self)
+        self._label_timer.setSingleShot(True)
+        self._label_timer.setInterval(_LABEL_REFRESH_MS)
+        self._label_timer.timeout.connect(self._refresh_offset_labels)
         self._build_ui()
 
     def _build_ui(self) -> None:
@@ -69,51 +92,22 @@ class CameraSettingsPanel(QGroupBox):
         layout.addRow("Frame Rate:", self._fps)
 
         # Lab-mode only controls (Basler pypylon parameters)
-        # Offset X slider — values are multiples of 4, range 0..1440
-        self._offset_x_slider = QSlider(Qt.Horizontal)
-        self._offset_x_slider.setRange(0, 1440 // 4)  # each step = 4 pixels
-        self._offset_x_slider.setValue(self._settings.offset_x // 4)
-        self._offset_x_value = QLabel(str(self._settings.offset_x))
-        self._offset_x_value.setMinimumWidth(40)
-        self._offset_x_slider.valueChanged.connect(
-            lambda v: self._offset_x_value.setText(str(v * 4))
-        )
-        self._offset_x_slider.sliderReleased.connect(self.settings_changed)
-        ox_widget = QWidget()
-        ox_layout = QHBoxLayout()
-        ox_layout.setContentsMargins(0, 0, 0, 0)
-        ox_layout.addWidget(self._offset_x_slider)
-        ox_layout.addWidget(self._offset_x_value)
-        ox_widget.setLayout(ox_layout)
-        ox_widget.setToolTip(
-            "ROI horizontal offset in pixels (multiples of 4, 0 = left edge)"
+        # Offset sliders — values are multiples of 4, up to the sensor size
+        self._offset_x_widget, self._offset_x_slider, self._offset_x_value = (
+            self._make_offset_row(
+                1440, self._settings.offset_x,
+                "ROI horizontal offset in pixels (multiples of 4, 0 = left edge)",
+            )
         )
-        self._offset_x_label = QLabel("Offset X:")
-        layout.addRow(self._offset_x_label, ox_widget)
-        self._offset_x_widget = ox_widget
-
-        # Offset Y slider — values are multiples of 4, range 0..1080
-        self._offset_y_slider = QSlider(Qt.Horizontal)
-        self._offset_y_slider.setRange(0, 1080 // 4)
-        self._offset_y_slider.setValue(self._settings.offset_y // 4)
-        self._offset_y_value = QLabel(str(self._settings.offset_y))
-        self._offset_y_value.setMinimumWidth(40)
-        self._offset_y_slider.valueChanged.connect(
-            lambda v: self._offset_y_value.setText(str(v * 4))
-        )
-        self._offset_y_slider.sliderReleased.connect(self.settings_changed)
-        oy_widget = QWidget()
-        oy_layout = QHBoxLayout()
-        oy_layout.setContentsMargins(0, 0, 0, 0)
-        oy_layout.addWidget(self._offset_y_slider)
-        oy_layout.addWidget(self._offset_y_value)
-        oy_widget.setLayout(oy_layout)
-        oy_widget.setToolTip(
-            "ROI vertical offset in pixels (multiples of 4, 0 = top edge)"
+        layout.addRow("Offset X:", self._offset_x_widget)
+
+        self._offset_y_widget, self._offset_y_slider, self._offset_y_value = (
+            self._make_offset_row(
+                1080, self._settings.offset_y,
+                "ROI vertical offset in pixels (multiples of 4, 0 = top edge)",
+            )
         )
-        self._offset_y_label = QLabel("Offset Y:")
-        layout.addRow(self._offset_y_label, oy_widget)
-        self._offset_y_widget = oy_widget
+        layout.addRow("Offset Y:", self._offset_y_widget)
 
         # Gamma
         self._gamma = QDoubleSpinBox()
@@ -124,33 +118,77 @@ class CameraSettingsPanel(QGroupBox):
         self._gamma.setToolTip(
             "Image gamma correction (1.0 = linear, no correction)"
         )
-        self._gamma_label = QLabel("Gamma:")
-        layout.addRow(self._gamma_label, self._gamma)
+        layout.addRow("Gamma:", self._gamma)
+
+        # Typing a multi-digit value should not report every keystroke
+        for spin in (
+            self._width, self._height, self._exposure,
+            self._gain, self._fps, self._gamma,
+        ):
+            spin.setKeyboardTracking(False)
 
-        # Hide lab-mode controls in dev mode
+        # Hide lab-mode controls (and their row labels) in dev mode
         if self._dev_mode:
-            for widget in (
-                self._offset_x_widget, self._offset_x_label,
-                self._offset_y_widget, self._offset_y_label,
-                self._gamma, self._gamma_label,
+            for field in (
+                self._offset_x_widget, self._offset_y_widget, self._gamma,
             ):
-                widget.setVisible(False)
+                field.setVisible(False)
+                layout.labelForField(field).setVisible(False)
 
         self.setLayout(layout)
 
+    def _make_offset_row(self, max_px: int, value: int, tooltip: str):
+        """Build a 4-pixel-step offset slider with its value label.
+
+        Returns ``(row_widget, slider, value_label)``.
+        """
+        slider = QSlider(Qt.Horizontal)
+        slider.setRange(0, max_px // 4)  # each step = 4 pixels
+        slider.setValue(value // 4)
+        value_label = QLabel(str(value))
+        value_label.setMinimumWidth(40)
+        slider.valueChanged.connect(self._on_offset_changed)
+        slider.sliderReleased.connect(self._apply_timer.start)
+        row = QWidget()
+        row_layout = QHBoxLayout()
+        row_layout.setContentsMargins(0, 0, 0, 0)
+        row_layout.addWidget(slider)
+        row_layout.addWidget(value_label)
+        row.setLayout(row_layout)
+        row.setToolTip(tooltip)
+        return row, slider, value_label
+
+    @pyqtSlot()
+    def _on_offset_changed(self) -> None:
+        # Leave a pending refresh alone so a drag updates the labels at a steady rate
+        if not self._label_timer.isActive():
+            self._label_timer.start()
+
+    @pyqtSlot()
+    def _refresh_offset_labels(self) -> None:
+        self._offset_x_value.setText(_OFFSET_TEXT[self._offset_x_slider.value()])
+        self._offset_y_value.setText(_OFFSET_TEXT[self._offset_y_slider.value()])
+
     def apply_to_settings(self, settings: CameraSettings) -> CameraSettings:
-        """Read widget values into a new CameraSettings."""
-        return CameraSettings(
-            model_name=settings.model_name,
-            expected_serial=settings.expected_serial,
+        """Read widget values into a new CameraSettings.
+
+        Fields without a widget are carried over from *settings*. Returns
+        the previously built object when the result compares equal to it.
+        """
+        fps = self._fps.value()
+        values = dict(
             width=self._width.value(),
             height=self._height.value(),
             pixel_format=self._pixel_format.currentText(),
             exposure_time_us=self._exposure.value(),
             gain_db=self._gain.value(),
-            target_frame_rate=self._fps.value(),
-            playback_fps=self._fps.value(),
+            target_frame_rate=fps,
+            playback_fps=fps,
             offset_x=self._offset_x_slider.value() * 4,
             offset_y=self._offset_y_slider.value() * 4,
             gamma=self._gamma.value(),
         )
+        new = replace(settings, **values)
+        if new != self._applied:
+            self._applied = new
+        return self._applied
@@ -16,13 +16,36 @@ from core.enums import ExperimentState
 class SpinnerWidget(QWidget):
     """Windows-style spinning circle indicator with rotating dots."""
 
+    _STEP_DEG = 30  # rotation per timer tick
+
     def __init__(self, size: int = 28, parent=None):
         super().__init__(parent)
         self._dot_count = 8
-        self._angle = 0
+        self._phase = 0
         self._color = QColor("#1565c0")
         self.setFixedSize(size, size)
 
+        # The size is fixed, so every frame of the animation is known up
+        # front: one list of dot rects per rotation step, and one colour
+        # per dot (trailing dots fade out and shrink).
+        self._colors = []
+        for i in range(self._dot_count):
+            color = QColor(self._color)
+            color.setAlphaF(max(0.15, 1.0 - i * 0.12))
+            self._colors.append(color)
+        cx = cy = size / 2
+        radius = size / 2 - 4
+        self._frames = []
+        for angle in range(0, 360, self._STEP_DEG):
+            rects = []
+            for i in range(self._dot_count):
+                angle_rad = math.radians(angle + i * (360 / self._dot_count))
+                x = cx + radius * math.cos(angle_rad)
+                y = cy + radius * math.sin(angle_rad)
+                dot_r = max(1.5, 3.0 - i * 0.2)
+                rects.append(QRectF(x - dot_r, y - dot_r, dot_r * 2, dot_r * 2))
+            self._frames.append(rects)
+
         self._timer = QTimer(self)
         self._timer.timeout.connect(self._rotate)
 
@@ -32,36 +55,45 @@ class SpinnerWidget(QWidget):
     def stop(self) -> None:
         self._timer.stop()
 
+    # The animation runs exactly while the spinner is on screen, so callers
+    # only need to show/hide its container
+    def showEvent(self, event) -> None:
+        self.start()
+        super().showEvent(event)
+
+    def hideEvent(self, event) -> None:
+        self.stop()
+        super().hideEvent(event)
+
     def _rotate(self) -> None:
-        self._angle = (self._angle + 30) % 360
+        self._phase = (self._phase + 1) % len(self._frames)
         self.update()
 
     def paintEvent(self, event) -> None:
         painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing)
-
-        w, h = self.width(), self.height()
-        cx, cy = w / 2, h / 2
-        radius = min(w, h) / 2 - 4
-
-        for i in range(self._dot_count):
-            angle_rad = math.radians(self._angle + i * (360 / self._dot_count))
-            x = cx + radius * math.cos(angle_rad)
-            y = cy + radius * math.sin(angle_rad)
-
-            # Trailing dots fade out and shrink
-            opacity = max(0.15, 1.0 - i * 0.12)
-            dot_r = max(1.5, 3.0 - i * 0.2)
-
-            color = QColor(self._color)
-            color.setAlphaF(opacity)
-            painter.setPen(Qt.NoPen)
+        painter.setPen(Qt.NoPen)
+        for rect, color in zip(self._frames[self._phase], self._colors):
             painter.setBrush(color)
-            painter.drawEllipse(QRectF(x - dot_r, y - dot_r, dot_r * 2, dot_r * 2))
-
+            painter.drawEllipse(rect)
         painter.end()
 
 
+# Widgets (by attribute name) visible in each state; any state not listed
+# shows none of them
+_VISIBLE_FOR_STATE = {
+    ExperimentState.IDLE: frozenset({"_start_btn"}),
+    ExperimentState.RUNNING: frozenset({"_pause_btn", "_stop_btn"}),
+    ExperimentState.PAUSED: frozenset({"_pause_btn", "_stop_btn"}),
+    ExperimentState.WAITING_CONFIRM: frozenset({"_confirm_btn", "_stop_btn"}),
+}
+_PREPARING_VISIBLE = frozenset({"_wait_container"})
+# Every widget whose visibility follows the experiment state
+_STATE_WIDGETS = (
+    "_start_btn", "_pause_btn", "_confirm_btn", "_stop_btn", "_wait_container",
+)
+
+
 class ControlPanel(QGroupBox):
     """Experiment control buttons with dynamic visibility."""
 
@@ -110,7 +142,17 @@ class ControlPanel(QGroupBox):
         self._stop_btn.hide()
         btn_layout.addWidget(self._stop_btn)
 
-        # "Please wait" container with spinner + label
+        # "Please wait" container is built on first use; see _ensure_wait_container
+        self._wait_container = None
+        self._btn_layout = btn_layout
+
+        layout.addLayout(btn_layout)
+        self.setLayout(layout)
+
+    def _ensure_wait_container(self) -> None:
+        """Build the 'Please wait' spinner + label the first time it's needed."""
+        if self._wait_container is not None:
+            return
         self._wait_container = QWidget()
         wait_layout = QHBoxLayout()
         wait_layout.setContentsMargins(0, 0, 0, 0)
@@ -129,73 +171,57 @@ class ControlPanel(QGroupBox):
         wait_layout.addStretch()
         self._wait_container.setLayout(wait_layout)
         self._wait_container.hide()
-        btn_layout.addWidget(self._wait_container)
-
-        layout.addLayout(btn_layout)
-        self.setLayout(layout)
+        self._btn_layout.addWidget(self._wait_container)
 
     def _on_pause_toggle(self) -> None:
         if self._is_paused:
             self.resume_clicked.emit()
-            self._pause_btn.setText("Pause")
-            self._is_paused = False
+            self._set_paused(False)
         else:
             self.pause_clicked.emit()
-            self._pause_btn.setText("Resume")
-            self._is_paused = True
+            self._set_paused(True)
+
+    def _set_paused(self, paused: bool) -> None:
+        """Record the pause state; the button label only changes with it."""
+        if paused != self._is_paused:
+            self._is_paused = paused
+            self._pause_btn.setText("Resume" if paused else "Pause")
+
+    def _show_only(self, visible: frozenset) -> None:
+        """Show the named widgets and hide the rest, touching only those that change."""
+        for name in _STATE_WIDGETS:
+            widget = getattr(self, name)
+            if widget is None:
+                continue  # wait container not built yet
+            show = name in visible
+            if widget.isHidden() == show:
+                widget.setVisible(show)
 
     def set_preparing(self) -> None:
         """Show 'Please wait' with spinner instead of buttons while engine initializes."""
         self._preparing = True
-        self._start_btn.hide()
-        self._pause_btn.hide()
-        self._confirm_btn.hide()
-
-        self._stop_btn.hide()
-        self._wait_container.show()
-        self._spinner.start()
+        self._ensure_wait_container()
+        self._show_only(_PREPARING_VISIBLE)
 
     def update_for_state(self, state: ExperimentState) -> None:
         """Show/hide buttons based on experiment state."""
-        # Hide all first
-        self._start_btn.hide()
-        self._pause_btn.hide()
-        self._confirm_btn.hide()
-
-        self._stop_btn.hide()
-        self._wait_container.hide()
-        self._spinner.stop()
-
-        if state == ExperimentState.IDLE:
-            self._start_btn.show()
-
-        elif state == ExperimentState.RUNNING:
-            if self._preparing:
-                # Still initializing — keep showing "Please wait" with spinner
-                self._wait_container.show()
-                self._spinner.start()
-                return
-            self._pause_btn.show()
-            self._stop_btn.show()
-
-        elif state == ExperimentState.PAUSED:
-            self._pause_btn.show()
-            self._pause_btn.setText("Resume")
-            self._is_paused = True
-            self._stop_btn.show()
-
-        elif state == ExperimentState.WAITING_CONFIRM:
-            self._preparing = False  # Engine is ready
-            self._confirm_btn.show()
-            self._stop_btn.show()
-
-        elif state in (ExperimentState.COMPLETED, ExperimentState.ABORTED, ExperimentState.ERROR):
+        if state == ExperimentState.RUNNING and self._preparing:
+            # Still initializing — keep showing "Please wait" with spinner
+            self._ensure_wait_container()
+            self._show_only(_PREPARING_VISIBLE)
+            return
+
+        if state == ExperimentState.PAUSED:
+            self._set_paused(True)
+        elif state in (
+            ExperimentState.WAITING_CONFIRM,  # Engine is ready
+            ExperimentState.COMPLETED, ExperimentState.ABORTED, ExperimentState.ERROR,
+        ):
             self._preparing = False
-            pass
+
+        self._show_only(_VISIBLE_FOR_STATE.get(state, frozenset()))
 
     def set_idle(self) -> None:
         """Reset to idle state."""
-        self._is_paused = False
-        self._pause_btn.setText("Pause")
-        self._start_btn.setText("Start")
+        self._set_paused(False)
         self.update_for_state(ExperimentState.IDLE)
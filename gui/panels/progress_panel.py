@@ -9,11 +9,32 @@ from PyQt5.QtWidgets import QGroupBox, QVBoxLayout, QLabel, QProgressBar
 from core.enums import TrialPhase
 
 
+# Phase label texts, built once
+_PHASE_TEXT = {
+    phase: f"Phase: {name}"
+    for phase, name in (
+        (TrialPhase.TRAINING_SHAPE, "Training - Shape Display"),
+        (TrialPhase.TRAINING_BLANK, "Training - Blank"),
+        (TrialPhase.INSTRUCTION_CLOSE_EYES, "Instruction - Close Eyes"),
+        (TrialPhase.INSTRUCTION_WAIT, "Instruction - Waiting"),
+        (TrialPhase.INSTRUCTION_STARTING, "Instruction - Starting"),
+        (TrialPhase.INSTRUCTION_READY, "Instruction - Ready"),
+        (TrialPhase.MEASUREMENT_BEEP, "Measurement - Beep"),
+        (TrialPhase.MEASUREMENT_SILENCE, "Measurement - Silence"),
+        (TrialPhase.INSTRUCTION_POST, "Instruction - Post"),
+        (TrialPhase.INTER_TRIAL, "Inter-trial Gap"),
+    )
+}
+
+
 class ProgressPanel(QGroupBox):
     """Shows overall and current-turn progress bars with phase label."""
 
     def __init__(self, parent=None):
         super().__init__("Progress", parent)
+        # Last values shown by the two bars; repeats are skipped
+        self._overall_shown = None
+        self._turn_shown = None
         self._build_ui()
 
     def _build_ui(self) -> None:
@@ -51,26 +72,23 @@ class ProgressPanel(QGroupBox):
         self._phase_label.setText(f"Phase: {text}")
 
     def set_phase(self, phase: TrialPhase, remaining: float) -> None:
-        phase_names = {
-            TrialPhase.TRAINING_SHAPE: "Training - Shape Display",
-            TrialPhase.TRAINING_BLANK: "Training - Blank",
-            TrialPhase.INSTRUCTION_CLOSE_EYES: "Instruction - Close Eyes",
-            TrialPhase.INSTRUCTION_WAIT: "Instruction - Waiting",
-            TrialPhase.INSTRUCTION_STARTING: "Instruction - Starting",
-            TrialPhase.INSTRUCTION_READY: "Instruction - Ready",
-            TrialPhase.MEASUREMENT_BEEP: "Measurement - Beep",
-            TrialPhase.MEASUREMENT_SILENCE: "Measurement - Silence",
-            TrialPhase.INSTRUCTION_POST: "Instruction - Post",
-            TrialPhase.INTER_TRIAL: "Inter-trial Gap",
-        }
-        self._phase_label.setText(f"Phase: {phase_names.get(phase, str(phase))}")
+        text = _PHASE_TEXT.get(phase)
+        if text is None:
+            text = f"Phase: {phase}"
+        self._phase_label.setText(text)
 
     def set_overall_progress(self, current: int, total: int) -> None:
+        if (current, total) == self._overall_shown:
+            return
+        self._overall_shown = (current, total)
         pct = int(current / total * 100) if total > 0 else 0
         self._overall_bar.setValue(pct)
         self._overall_bar.setFormat(f"{current}/{total} ({pct}%)")
 
     def set_turn_progress(self, current_shape: int, total_shapes: int) -> None:
+        if (current_shape, total_shapes) == self._turn_shown:
+            return
+        self._turn_shown = (current_shape, total_shapes)
         pct = int(current_shape / total_shapes * 100) if total_shapes > 0 else 0
         self._turn_bar.setValue(pct)
         self._turn_bar.setFormat(f"{current_shape}/{total_shapes} shapes ({pct}%)")
@@ -84,4 +102,5 @@ class ProgressPanel(QGroupBox):
         self._overall_bar.setFormat("0/0 (0%)")
         self._turn_bar.setValue(0)
         self._turn_bar.setFormat("0/0 shapes (0%)")
+        self._overall_shown = self._turn_shown = (0, 0)
         self._status_label.setText("Ready")
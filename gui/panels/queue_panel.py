@@ -5,6 +5,7 @@ from __future__ import annotations
 from typing import List, Optional
 
 from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QBrush
 from PyQt5.QtWidgets import (
     QGroupBox, QVBoxLayout, QListWidget, QListWidgetItem, QLabel,
 )
@@ -13,11 +14,20 @@ from core.session_queue import QueueItem
 from gui.panels.end_time_panel import EndTimePanel
 
 
+# Row brushes, built once rather than converted from Qt colours per call
+_BG_DONE = QBrush(Qt.darkGreen)
+_BG_CURRENT = QBrush(Qt.darkCyan)
+_BG_PENDING = QBrush(Qt.transparent)
+_FG_LIGHT = QBrush(Qt.white)
+_FG_DARK = QBrush(Qt.black)
+
+
 class QueuePanel(QGroupBox):
     """Displays the interleaved subject x rep queue."""
 
     def __init__(self, parent=None):
         super().__init__("Session Queue", parent)
+        self._highlighted: Optional[int] = None  # index last passed to highlight_index
         self._build_ui()
 
     def _build_ui(self) -> None:
@@ -38,29 +48,51 @@ class QueuePanel(QGroupBox):
     def load_queue(self, items: List[QueueItem]) -> None:
         """Populate the list from queue items."""
         self._list.clear()
-        for i, item in enumerate(items):
-            shapes_str = ", ".join(
-                s.value if hasattr(s, "value") else str(s) for s in item.shapes
-            )
-            text = f"[{i+1}] {item.subject} | Rep {item.rep} | {shapes_str}"
-            list_item = QListWidgetItem(text)
-            list_item.setFlags(list_item.flags() & ~Qt.ItemIsSelectable)
-            self._list.addItem(list_item)
+        self._highlighted = None
+        # One repaint for the whole batch instead of one per inserted row
+        self._list.setUpdatesEnabled(False)
+        self._list.blockSignals(True)
+        try:
+            # Items share one shape_names tuple, so join it only when it changes
+            last_names, shapes_str = None, ""
+            for i, item in enumerate(items):
+                if item.shape_names is not last_names:
+                    last_names = item.shape_names
+                    shapes_str = ", ".join(last_names)
+                text = f"[{i+1}] {item.subject} | Rep {item.rep} | {shapes_str}"
+                list_item = QListWidgetItem(text)
+                list_item.setFlags(list_item.flags() & ~Qt.ItemIsSelectable)
+                self._list.addItem(list_item)
+        finally:
+            self._list.blockSignals(False)
+            self._list.setUpdatesEnabled(True)
         self._status_label.setText(f"{len(items)} items in queue")
 
     def highlight_index(self, index: int) -> None:
-        """Highlight the current queue item and mark completed ones."""
-        for i in range(self._list.count()):
+        """Highlight the current queue item and mark completed ones.
+
+        Only rows whose state changed since the previous call (those
+        between the old and new index) are restyled.
+        """
+        prev = self._highlighted
+        if index == prev:
+            return
+        self._highlighted = index
+        if prev is None:
+            rows = range(self._list.count())
+        else:
+            rows = range(min(prev, index), min(max(prev, index) + 1, self._list.count()))
+        for i in rows:
             item = self._list.item(i)
             if i < index:
-                item.setBackground(Qt.darkGreen)
-                item.setForeground(Qt.white)
+                item.setBackground(_BG_DONE)
+                item.setForeground(_FG_LIGHT)
             elif i == index:
-                item.setBackground(Qt.darkCyan)
-                item.setForeground(Qt.white)
+                item.setBackground(_BG_CURRENT)
+                item.setForeground(_FG_LIGHT)
             else:
-                item.setBackground(Qt.transparent)
-                item.setForeground(Qt.black)
+                item.setBackground(_BG_PENDING)
+                item.setForeground(_FG_DARK)
         # Scroll to current
         if index < self._list.count():
             self._list.scrollToItem(self._list.item(index))
@@ -68,11 +100,13 @@ class QueuePanel(QGroupBox):
     def clear(self) -> None:
         """Remove all items from the queue display."""
         self._list.clear()
+        self._highlighted = None
         self._status_label.setText("No queue loaded")
 
     def mark_all_complete(self) -> None:
         for i in range(self._list.count()):
             item = self._list.item(i)
-            item.setBackground(Qt.darkGreen)
-            item.setForeground(Qt.white)
+            item.setBackground(_BG_DONE)
+            item.setForeground(_FG_LIGHT)
+        self._highlighted = self._list.count()
         self._status_label.setText("Session complete")
@@ -8,25 +8,85 @@ from __future__ import annotations
 
 import math
 
-from PyQt5.QtCore import Qt
-from PyQt5.QtGui import QPainter, QColor, QFont, QPen, QPolygonF
+from PyQt5.QtCore import Qt, QPointF
+from PyQt5.QtGui import QPainter, QColor, QFont, QPen, QPolygonF, QTransform
 from PyQt5.QtWidgets import QGroupBox, QVBoxLayout, QWidget
 
 
+def _unit_polygon(radii) -> QPolygonF:
+    """Polygon around the origin with one vertex per radius, evenly spaced,
+    first vertex pointing up (Qt Y is flipped)."""
+    step = 360 / len(radii)
+    points = QPolygonF()
+    for i, r in enumerate(radii):
+        angle = math.radians(90 + i * step)
+        points.append(QPointF(r * math.cos(angle), -r * math.sin(angle)))
+    return points
+
+
+# Polygon shapes at unit size; scaled and centred per paint with a QTransform
+_UNIT_POLYGONS = {
+    "triangle": _unit_polygon((1.0,) * 3),
+    "star": _unit_polygon((1.0, 0.4) * 5),  # outer / inner points
+}
+
+# Mirror text for each "instruction:<key>" state
+_INSTRUCTION_TEXT = {
+    "close_eyes": "Close your eyes...",
+    "starting": "Starting...",
+    "open_your_eyes": "Open your eyes",
+    "next_participant": "Next participant...",
+    "experiment_completed": "Experiment completed!",
+}
+
+_BLACK = QColor(0, 0, 0)
+_WHITE = QColor(255, 255, 255)
+_GRAY = QColor(128, 128, 128)
+_RED = QColor(255, 0, 0)
+
+
 class _MirrorCanvas(QWidget):
     """Custom widget that draws a mirror of the participant display."""
 
     def __init__(self, parent=None):
         super().__init__(parent)
         self._state = "idle"
+        # Parsed form of self._state; see set_state
+        self._mode = "idle"
+        self._payload = ""
         self._shape_color = QColor(255, 255, 255)  # default white
         self.setMinimumSize(200, 150)
+        # paintEvent fills every pixel itself, so skip Qt's background clear
+        self.setAttribute(Qt.WA_OpaquePaintEvent, True)
+        self.setAttribute(Qt.WA_NoSystemBackground, True)
+        self.setAutoFillBackground(False)
+        # Fonts are built here, not at import, since they need the QApplication
+        self._font_recording = QFont("Segoe UI", 14, QFont.Bold)
+        self._font_instruction = QFont("Segoe UI", 12)
+        self._font_idle = QFont("Segoe UI", 11)
+        self._font_other = QFont("Segoe UI", 10)
 
     def set_shape_color(self, hex_color: str) -> None:
-        self._shape_color = QColor(hex_color)
+        color = QColor(hex_color)
+        if color != self._shape_color:
+            self._shape_color = color
+            self.update()  # set_state skips repaints while the state is unchanged
 
     def set_state(self, state: str) -> None:
+        if state == self._state:
+            return  # repeated update; what's on screen is already right
         self._state = state
+        # Parse once here rather than in paintEvent, which also runs on resize
+        kind, sep, arg = state.partition(":")
+        if sep and kind == "shape":
+            self._mode, self._payload = "shape", arg
+        elif sep and kind == "instruction":
+            self._mode = "instruction"
+            self._payload = _INSTRUCTION_TEXT.get(arg, arg)
+        elif state in ("blank", "recording", "idle"):
+            self._mode, self._payload = state, ""
+        else:
+            self._mode, self._payload = "other", state
         self.update()
 
     def paintEvent(self, event) -> None:
@@ -35,49 +95,39 @@ class _MirrorCanvas(QWidget):
         w, h = self.width(), self.height()
 
         # Black background
-        p.fillRect(0, 0, w, h, QColor(0, 0, 0))
+        p.fillRect(0, 0, w, h, _BLACK)
 
-        state = self._state
+        mode = self._mode
 
-        if state.startswith("shape:"):
-            shape_name = state.split(":")[1]
-            self._draw_shape(p, shape_name, w, h)
+        if mode == "shape":
+            self._draw_shape(p, self._payload, w, h)
 
-        elif state == "blank":
+        elif mode == "blank":
             pass  # Already black
 
-        elif state == "recording":
+        elif mode == "recording":
             # Red dot + text
-            p.setPen(QColor(255, 255, 255))
-            p.setFont(QFont("Segoe UI", 14, QFont.Bold))
+            p.setPen(_WHITE)
+            p.setFont(self._font_recording)
             p.drawText(0, 0, w, h, Qt.AlignCenter, "Recording...")
-            p.setBrush(QColor(255, 0, 0))
+            p.setBrush(_RED)
             p.setPen(Qt.NoPen)
             p.drawEllipse(w // 2 - 60, h // 2 - 30, 12, 12)
 
-        elif state.startswith("instruction:"):
-            instruction = state.split(":")[1]
-            text_map = {
-                "close_eyes": "Close your eyes...",
-                "starting": "Starting...",
-                "open_your_eyes": "Open your eyes",
-                "next_participant": "Next participant...",
-                "experiment_completed": "Experiment completed!",
-            }
-            text = text_map.get(instruction, instruction)
-            p.setPen(QColor(255, 255, 255))
-            p.setFont(QFont("Segoe UI", 12))
-            p.drawText(0, 0, w, h, Qt.AlignCenter | Qt.TextWordWrap, text)
-
-        elif state == "idle":
-            p.setPen(QColor(128, 128, 128))
-            p.setFont(QFont("Segoe UI", 11))
+        elif mode == "instruction":
+            p.setPen(_WHITE)
+            p.setFont(self._font_instruction)
+            p.drawText(0, 0, w, h, Qt.AlignCenter | Qt.TextWordWrap, self._payload)
+
+        elif mode == "idle":
+            p.setPen(_GRAY)
+            p.setFont(self._font_idle)
             p.drawText(0, 0, w, h, Qt.AlignCenter, "Waiting...")
 
         else:
-            p.setPen(QColor(128, 128, 128))
-            p.setFont(QFont("Segoe UI", 10))
-            p.drawText(0, 0, w, h, Qt.AlignCenter, state)
+            p.setPen(_GRAY)
+            p.setFont(self._font_other)
+            p.drawText(0, 0, w, h, Qt.AlignCenter, self._payload)
 
         p.end()
 
@@ -96,28 +146,10 @@ class _MirrorCanvas(QWidget):
             p.drawRect(int(cx - size), int(cy - size),
                         int(size * 2), int(size * 2))
 
-        elif shape == "triangle":
-            points = QPolygonF()
-            for i in range(3):
-                angle = math.radians(90 + i * 120)
-                x = cx + size * math.cos(angle)
-                y = cy - size * math.sin(angle)  # Qt Y is flipped
-                from PyQt5.QtCore import QPointF
-                points.append(QPointF(x, y))
-            p.drawPolygon(points)
-
-        elif shape == "star":
-            points = QPolygonF()
-            outer = size
-            inner = size * 0.4
-            for i in range(10):
-                angle = math.radians(90 + i * 36)
-                r = outer if i % 2 == 0 else inner
-                x = cx + r * math.cos(angle)
-                y = cy - r * math.sin(angle)
-                from PyQt5.QtCore import QPointF
-                points.append(QPointF(x, y))
-            p.drawPolygon(points)
+        else:
+            unit = _UNIT_POLYGONS.get(shape)
+            if unit is not None:
+                p.drawPolygon(QTransform(size, 0, 0, size, cx, cy).map(unit))
 
 
 class StimulusMirrorPanel(QGroupBox):
@@ -50,7 +50,12 @@ class CameraBackend(ABC):
 
     @abstractmethod
     def get_preview_frame(self) -> Optional[np.ndarray]:
-        """Return the latest frame for live preview (non-blocking)."""
+        """Return the latest frame for live preview (non-blocking).
+
+        The array may be owned by the backend and reused for a later
+        frame, so it is only valid for immediate display; callers that
+        keep or modify it must copy it first.
+        """
 
     @abstractmethod
     def update_settings(self, settings: CameraSettings) -> None:
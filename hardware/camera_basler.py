@@ -6,8 +6,8 @@ Adapts proven patterns from basler_camera_test.py:
 - InstantCamera with CreateDevice
 - ROI centering with even offsets
 - Auto-exposure/gain off before manual values
-- GrabStrategy_LatestImageOnly
-- MJPG codec via OpenCV VideoWriter
+- GrabStrategy_LatestImageOnly, started once per connection
+- MJPG codec via OpenCV VideoWriter (or H.264 on NVENC when enabled)
 - IsGrabbing/IsOpen cleanup guards
 """
 
@@ -17,16 +17,140 @@ import logging
 import threading
 import time
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
 import cv2
 import numpy as np
 
 from config.settings import CameraSettings
+from utils.threading_utils import boost_current_thread
 from .camera_base import CameraBackend
 
 logger = logging.getLogger(__name__)
 
+# Preview frames are only needed at about the GUI poll rate (~20 fps); the
+# preview loop rests this long between grabs rather than copying every frame
+_PREVIEW_PERIOD_S = 0.05
+
+# Frames that can wait for the encoder before new ones are dropped
+_RING_SIZE = 8
+
+
+class _NvencWriter:
+    """Adapts a cv2.cudacodec writer to the VideoWriter calls used here."""
+
+    def __init__(self, writer):
+        self._writer = writer
+        self._gpu_frame = cv2.cuda_GpuMat()  # reused for every upload
+
+    def write(self, frame: np.ndarray) -> None:
+        self._gpu_frame.upload(frame)
+        self._writer.write(self._gpu_frame)
+
+    def release(self) -> None:
+        self._writer.release()
+
+
+def _open_nvenc_writer(output_path: Path, fps: float, size) -> Optional[_NvencWriter]:
+    """H.264 writer on the GPU's NVENC encoder, or None if unavailable.
+
+    Needs an OpenCV build with CUDA and the cudacodec module.
+    """
+    try:
+        cudacodec = cv2.cudacodec
+        params = cudacodec.EncoderParams()
+        params.rateControlMode = cudacodec.ENC_PARAMS_RC_VBR
+        params.targetQuality = 28
+        params.gopLength = max(1, int(fps))
+        writer = cudacodec.createVideoWriter(
+            str(output_path), size, cudacodec.H264, fps,
+            cudacodec.ColorFormat_GRAY, params,
+        )
+    except (AttributeError, cv2.error) as e:
+        logger.warning("NVENC writer unavailable, falling back to MJPG: %s", e)
+        return None
+    return _NvencWriter(writer)
+
+
+def _open_mjpg_writer(
+    output_path: Path, fps: float, size, quality: int,
+) -> cv2.VideoWriter:
+    """MJPG AVI writer for mono frames.
+
+    Prefers OpenCV's built-in MJPEG encoder, which writes single-channel
+    frames as grayscale JPEGs directly; the FFmpeg/MSMF backends convert
+    every frame to a colour pixel format first. Falls back to the default
+    backend if the built-in one can't open the file.
+
+    The built-in encoder also honours the JPEG *quality* and is told to
+    split each frame into as many stripes as it likes (NSTRIPES -1), so
+    it encodes on several cores.
+    """
+    fourcc = cv2.VideoWriter_fourcc(*"MJPG")
+    writer = cv2.VideoWriter(
+        str(output_path), cv2.CAP_OPENCV_MJPEG, fourcc, fps, size, isColor=False,
+    )
+    if writer.isOpened():
+        writer.set(cv2.VIDEOWRITER_PROP_QUALITY, quality)
+        writer.set(cv2.VIDEOWRITER_PROP_NSTRIPES, -1)
+    else:
+        writer = cv2.VideoWriter(str(output_path), fourcc, fps, size, isColor=False)
+    return writer
+
+
+class _FrameRing:
+    """Bounded single-producer/single-consumer queue of preallocated frames.
+
+    The grab thread copies each frame into a free slot with put(); the
+    encoder thread takes the oldest with peek() and hands the slot back
+    with release() once it has been written. When every slot is still
+    waiting for the encoder the incoming frame is dropped (and counted),
+    never a slot the encoder may be reading.
+    """
+
+    def __init__(self, size: int):
+        self._slots: List[Optional[np.ndarray]] = [None] * size
+        self._head = 0  # total frames put
+        self._tail = 0  # total frames released
+        self._closed = False
+        self._cond = threading.Condition()
+        self.dropped = 0
+
+    def put(self, src: np.ndarray) -> Optional[np.ndarray]:
+        """Queue a copy of *src*; returns the slot it went into, or None
+        if the frame was dropped."""
+        with self._cond:
+            if self._head - self._tail == len(self._slots):
+                self.dropped += 1
+                return None
+            i = self._head % len(self._slots)
+        # The slot isn't visible to the consumer until head moves past it
+        dst = self._slots[i]
+        if dst is None or dst.shape != src.shape or dst.dtype != src.dtype:
+            dst = self._slots[i] = np.empty_like(src)
+        np.copyto(dst, src)
+        with self._cond:
+            self._head += 1
+            self._cond.notify()
+        return dst
+
+    def peek(self) -> Optional[np.ndarray]:
+        """Wait for the oldest queued frame; None once closed and drained."""
+        with self._cond:
+            self._cond.wait_for(lambda: self._head != self._tail or self._closed)
+            if self._head == self._tail:
+                return None
+            return self._slots[self._tail % len(self._slots)]
+
+    def release(self) -> None:
+        with self._cond:
+            self._tail += 1
+
+    def close(self) -> None:
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+
 
 class BaslerCamera(CameraBackend):
     """Basler acA1440-220um USB3 backend via pypylon."""
@@ -38,8 +162,13 @@ class BaslerCamera(CameraBackend):
         self._recording = False
         self._record_thread: Optional[threading.Thread] = None
         self._frames_captured = 0
+        # Only ever rebound, never mutated in place, so readers need no lock:
+        # a reference assignment is atomic
         self._latest_frame: Optional[np.ndarray] = None
-        self._frame_lock = threading.Lock()
+        # Ping-pong pair of preview buffers, (re)allocated to the frame shape
+        # on first use; _latest_frame is always one of them
+        self._buffers: List[Optional[np.ndarray]] = [None, None]
+        self._write_idx = 0
         self._stop_event = threading.Event()
         # Continuous grab thread for live preview even when not recording
         self._grab_thread: Optional[threading.Thread] = None
@@ -88,6 +217,9 @@ class BaslerCamera(CameraBackend):
             raise RuntimeError("Camera failed to open")
 
         self._apply_settings(settings)
+        # One continuous grab session for the life of the connection, shared
+        # by preview and recording; re-arming per frame costs a USB round trip
+        self._start_grabbing()
         logger.info(
             "Connected to %s (S/N: %s)",
             target.GetModelName(),
@@ -100,6 +232,9 @@ class BaslerCamera(CameraBackend):
         )
         self._grab_thread.start()
 
+    def _start_grabbing(self) -> None:
+        self._camera.StartGrabbing(self._pylon.GrabStrategy_LatestImageOnly)
+
     def _apply_settings(self, s: CameraSettings) -> None:
         cam = self._camera
 
@@ -146,29 +281,48 @@ class BaslerCamera(CameraBackend):
         except Exception:
             logger.warning("Could not set Gamma")
 
+        # Grab buffer pool; only read by StartGrabbing, which follows
+        # every call to this method
+        try:
+            cam.MaxNumBuffer.SetValue(s.max_num_buffer)
+        except Exception:
+            logger.warning("Could not set MaxNumBuffer")
+
     def update_settings(self, settings: CameraSettings) -> None:
         """Apply new settings without disconnecting.
 
         Acquires the grab lock so the preview loop pauses while parameters
-        change, then resumes automatically.
+        change. ROI and pixel format are locked while the camera streams, so
+        grabbing is stopped around the change and then restarted. Ignored
+        while recording, since that would cut the recording short.
         """
         if not self.is_connected():
             return
+        if self._recording:
+            logger.warning("Live settings update ignored while recording")
+            return
         with self._grab_lock:
             try:
+                if self._camera.IsGrabbing():
+                    self._camera.StopGrabbing()
                 self._apply_settings(settings)
                 self._settings = settings
                 logger.info("Camera settings updated live (offset %d,%d)",
                             settings.offset_x, settings.offset_y)
             except Exception as e:
                 logger.warning("Live settings update failed: %s", e)
+            try:
+                if not self._camera.IsGrabbing():
+                    self._start_grabbing()
+            except Exception as e:
+                logger.warning("Could not restart grabbing: %s", e)
 
     def _grab_loop(self) -> None:
         """Continuously grab frames for preview when not recording.
 
-        Uses StartGrabbingMax(1) for single-frame grabs at ~20 fps
-        to keep the preview alive without interfering with recording.
-        The _grab_lock ensures no overlap with _record_loop.
+        Takes the latest frame from the connection's grab session about
+        every _PREVIEW_PERIOD_S. While recording, _record_loop is the only
+        reader; the _grab_lock ensures no overlap with it.
         """
         while not self._grab_stop.is_set():
             if self._recording:
@@ -182,19 +336,28 @@ class BaslerCamera(CameraBackend):
                     if self._recording:
                         # Recording started while we waited for the lock
                         continue
-                    self._camera.StartGrabbingMax(1)
-                    result = self._camera.RetrieveResult(
-                        1000, self._pylon.TimeoutHandling_Return,
-                    )
-                    if result and result.GrabSucceeded():
-                        frame = result.GetArray().copy()
-                        with self._frame_lock:
-                            self._latest_frame = frame
-                    if result:
-                        result.Release()
+                    with self._camera.RetrieveResult(
+                        100, self._pylon.TimeoutHandling_Return,
+                    ) as result:
+                        if result and result.GrabSucceeded():
+                            self._publish_frame(result.GetArray())
+                self._grab_stop.wait(_PREVIEW_PERIOD_S)
             except Exception:
                 time.sleep(0.05)
 
+    def _publish_frame(self, src: np.ndarray) -> None:
+        """Copy *src* into the idle preview buffer and make it the latest.
+
+        Only the grab or record thread calls this (never both at once), so
+        the buffer being written is never the one readers can see.
+        """
+        dst = self._buffers[self._write_idx]
+        if dst is None or dst.shape != src.shape or dst.dtype != src.dtype:
+            dst = self._buffers[self._write_idx] = np.empty_like(src)
+        np.copyto(dst, src)
+        self._latest_frame = dst
+        self._write_idx ^= 1
+
     def disconnect(self) -> None:
         self._grab_stop.set()
         if self._grab_thread is not None:
@@ -220,22 +383,22 @@ class BaslerCamera(CameraBackend):
         if not self.is_connected():
             return None
         try:
-            self._camera.StartGrabbingMax(1)
-            result = self._camera.RetrieveResult(
-                5000, self._pylon.TimeoutHandling_ThrowException
-            )
-            if result.GrabSucceeded():
-                frame = result.GetArray().copy()
-                result.Release()
-                return frame
-            result.Release()
+            with self._grab_lock:
+                if not self._camera.IsGrabbing():
+                    self._start_grabbing()
+                result = self._camera.RetrieveResult(
+                    5000, self._pylon.TimeoutHandling_ThrowException
+                )
+            with result:
+                if result.GrabSucceeded():
+                    return result.GetArray().copy()
         except Exception as e:
             logger.error("Frame grab failed: %s", e)
         return None
 
     def get_preview_frame(self) -> Optional[np.ndarray]:
-        with self._frame_lock:
-            return self._latest_frame.copy() if self._latest_frame is not None else None
+        # Reference only; see CameraBackend.get_preview_frame
+        return self._latest_frame
 
     # --- Recording ---
 
@@ -253,42 +416,71 @@ class BaslerCamera(CameraBackend):
         self._record_thread.start()
 
     def _record_loop(self, output_path: Path, fps: float) -> None:
+        # Wake promptly for each frame even when the PC is busy
+        if not boost_current_thread():
+            logger.debug("Could not raise record thread priority")
         s = self._settings
-        fourcc = cv2.VideoWriter_fourcc(*"MJPG")
-        writer = cv2.VideoWriter(
-            str(output_path), fourcc, fps,
-            (s.width, s.height), isColor=False,
-        )
-        if not writer.isOpened():
-            logger.error("Failed to open VideoWriter at %s", output_path)
-            self._recording = False
-            return
+        writer = None
+        if s.use_nvenc:
+            writer = _open_nvenc_writer(output_path, fps, (s.width, s.height))
+        if writer is None:
+            writer = _open_mjpg_writer(
+                output_path, fps, (s.width, s.height), s.mjpg_quality,
+            )
+            if not writer.isOpened():
+                logger.error("Failed to open VideoWriter at %s", output_path)
+                self._recording = False
+                return
 
-        # Acquire lock to ensure preview grab loop has finished its cycle
+        # Acquire lock to ensure preview grab loop has finished its cycle;
+        # after that it sees _recording and leaves the grab session to us
         with self._grab_lock:
-            if self._camera.IsGrabbing():
-                self._camera.StopGrabbing()
-            self._camera.StartGrabbing(self._pylon.GrabStrategy_LatestImageOnly)
+            if not self._camera.IsGrabbing():
+                self._start_grabbing()
+
+        # MJPG encoding runs on its own thread so a slow encode never holds
+        # up the next RetrieveResult
+        ring = _FrameRing(_RING_SIZE)
+        encoder = threading.Thread(
+            target=self._encode_loop, args=(ring, writer), daemon=True,
+        )
+        encoder.start()
 
         try:
             while not self._stop_event.is_set():
-                result = self._camera.RetrieveResult(
+                with self._camera.RetrieveResult(
                     1000, self._pylon.TimeoutHandling_Return
-                )
-                if result and result.GrabSucceeded():
-                    frame = result.GetArray()
-                    writer.write(frame)
-                    self._frames_captured += 1
-                    with self._frame_lock:
-                        self._latest_frame = frame.copy()
-                if result:
-                    result.Release()
+                ) as result:
+                    if result and result.GrabSucceeded():
+                        frame = result.GetArray()
+                        queued = ring.put(frame)
+                        if queued is not None:
+                            # Preview shares the queued copy; the slot is only
+                            # refilled _RING_SIZE frames later
+                            self._latest_frame = queued
+                        else:
+                            self._publish_frame(frame)
         finally:
-            if self._camera.IsGrabbing():
-                self._camera.StopGrabbing()
+            # Let the encoder flush what's queued before closing the file
+            ring.close()
+            encoder.join()
             writer.release()
+            if ring.dropped:
+                logger.warning(
+                    "Encoder fell behind: %d frames dropped", ring.dropped,
+                )
             self._recording = False
 
+    def _encode_loop(self, ring: _FrameRing, writer) -> None:
+        """Write queued frames to the video file until the ring is closed."""
+        while True:
+            frame = ring.peek()
+            if frame is None:
+                break
+            writer.write(frame)
+            ring.release()
+            self._frames_captured += 1
+
     def stop_recording(self) -> int:
         self._stop_event.set()
         if self._record_thread is not None:
@@ -26,8 +26,9 @@ class WebcamCamera(CameraBackend):
         self._recording = False
         self._record_thread: Optional[threading.Thread] = None
         self._frames_captured = 0
+        # Only ever rebound, never mutated in place, so readers need no lock:
+        # a reference assignment is atomic
         self._latest_frame: Optional[np.ndarray] = None
-        self._frame_lock = threading.Lock()
         self._stop_event = threading.Event()
         # Continuous grab thread for live preview even when not recording
         self._grab_thread: Optional[threading.Thread] = None
@@ -66,8 +67,7 @@ class WebcamCamera(CameraBackend):
             ret, frame = self._cap.read()
             if ret:
                 gray = self._to_gray_resized(frame)
-                with self._frame_lock:
-                    self._latest_frame = gray
+                self._latest_frame = gray
             else:
                 time.sleep(0.01)
 
@@ -93,8 +93,8 @@ class WebcamCamera(CameraBackend):
         return None
 
     def get_preview_frame(self) -> Optional[np.ndarray]:
-        with self._frame_lock:
-            return self._latest_frame.copy() if self._latest_frame is not None else None
+        # Reference only; see CameraBackend.get_preview_frame
+        return self._latest_frame
 
     def start_recording(self, output_path: Path, fps: float) -> None:
         if self._recording:
@@ -136,8 +136,7 @@ class WebcamCamera(CameraBackend):
                     gray = self._to_gray_resized(frame)
                     writer.write(gray)
                     self._frames_captured += 1
-                    with self._frame_lock:
-                        self._latest_frame = gray.copy()
+                    self._latest_frame = gray
                 else:
                     # Brief sleep to avoid busy-wait if read fails
                     time.sleep(0.01)
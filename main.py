@@ -10,7 +10,9 @@ Usage:
 from __future__ import annotations
 
 import argparse
+import importlib
 import sys
+import threading
 from pathlib import Path
 
 # Ensure the package root is on sys.path so relative imports work
@@ -25,6 +27,32 @@ from utils.logging_setup import setup_logging
 from gui.main_window import MainWindow
 
 
+# Modules imported when a session starts (by the engine thread, or by
+# MainWindow._on_start for the engine itself).  psychopy.visual
+# is deliberately absent (importing pyglet.gl creates a GL context on the
+# importing thread), as is psychopy.sound (audio prefs are only final
+# after the wizard calls configure_audio).
+_PREIMPORT_MODULES = (
+    "numpy",
+    "psychopy.core",
+    "psychopy.monitors",
+    "stimulus.shape_renderer",
+    "stimulus.stimulus_window",
+    "audio.audio_manager",
+    "core.trial_protocol",
+    "core.experiment_engine",
+)
+
+
+def _preimport() -> None:
+    """Import engine-side modules in the background while the wizard runs."""
+    for name in _PREIMPORT_MODULES:
+        try:
+            importlib.import_module(name)
+        except Exception:
+            pass  # the engine reports real import failures when it starts
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(
         description="LSCI Visual Mental Imagery Experiment",
@@ -57,6 +85,8 @@ def main() -> None:
     # Setup logging (console only until session starts)
     setup_logging()
 
+    threading.Thread(target=_preimport, daemon=True).start()
+
     # Launch application
     app = QApplication(sys.argv)
     app.setApplicationName("LSCI Experiment")
@@ -8,18 +8,57 @@ allocation during the frame loop.
 from __future__ import annotations
 
 import math
+from functools import lru_cache
 from typing import Union, List
 
 from core.enums import Shape
 
+_visual = None  # psychopy.visual once _psychopy_visual() has imported it
+
+
+def _psychopy_visual():
+    """Return ``psychopy.visual``, importing it on first use.
+
+    Not imported at module level: this module is pre-imported on a
+    background thread, and importing pyglet.gl creates a GL context on
+    the importing thread.
+    """
+    global _visual
+    if _visual is None:
+        from psychopy import visual
+        _visual = visual
+    return _visual
+
+
+def _unit_vertices(radii) -> tuple:
+    """Vertices around the origin, one per radius, evenly spaced with the
+    first pointing up."""
+    step = 360 / len(radii)
+    return tuple(
+        (r * math.cos(math.radians(90 + i * step)),
+         r * math.sin(math.radians(90 + i * step)))
+        for i, r in enumerate(radii)
+    )
+
+
+# Polygon shapes at unit radius, scaled to the requested size when built
+_TRIANGLE_UNIT = _unit_vertices((1.0,) * 3)
+_STAR_UNIT = _unit_vertices((1.0, 0.4) * 5)  # outer / inner points
+
+
+@lru_cache(maxsize=64)
+def _hex_rgb(h: str) -> tuple:
+    r, g, b = bytes.fromhex(h)
+    return (r / 127.5 - 1.0, g / 127.5 - 1.0, b / 127.5 - 1.0)
+
 
 def hex_to_psychopy(hex_color: str) -> list:
     """Convert '#RRGGBB' hex to PsychoPy [-1, 1] RGB list."""
     h = hex_color.lstrip("#")
     if len(h) != 6:
         return [1.0, 1.0, 1.0]  # default white
-    r, g, b = int(h[0:2], 16), int(h[2:4], 16), int(h[4:6], 16)
-    return [r / 127.5 - 1.0, g / 127.5 - 1.0, b / 127.5 - 1.0]
+    # Cached per colour; a fresh list so callers can't alter the cache
+    return list(_hex_rgb(h))
 
 
 def create_image_stim(win, image_path: str, size: float = 0.5):
@@ -33,8 +72,7 @@ def create_image_stim(win, image_path: str, size: float = 0.5):
     Returns:
         A PsychoPy ``ImageStim`` with a ``.draw()`` method.
     """
-    from psychopy import visual
-    return visual.ImageStim(
+    return _psychopy_visual().ImageStim(
         win, image=image_path,
         size=(size, size),
         units="height",
@@ -53,7 +91,7 @@ def create_shape_stim(win, shape: Shape, size: float = 0.5, color: str = "white"
     Returns:
         A PsychoPy stimulus object with a ``.draw()`` method.
     """
-    from psychopy import visual
+    visual = _psychopy_visual()
 
     if shape == Shape.CIRCLE:
         return visual.Circle(
@@ -71,26 +109,16 @@ def create_shape_stim(win, shape: Shape, size: float = 0.5, color: str = "white"
 
     elif shape == Shape.TRIANGLE:
         r = size / 2
-        vertices = []
-        for i in range(3):
-            angle = math.radians(90 + i * 120)
-            vertices.append((r * math.cos(angle), r * math.sin(angle)))
         return visual.ShapeStim(
-            win, vertices=vertices,
+            win, vertices=[(r * x, r * y) for x, y in _TRIANGLE_UNIT],
             fillColor=color, lineColor=color,
             units="height",
         )
 
     elif shape == Shape.STAR:
-        outer = size / 2
-        inner = outer * 0.4
-        vertices = []
-        for i in range(10):
-            angle = math.radians(90 + i * 36)
-            r = outer if i % 2 == 0 else inner
-            vertices.append((r * math.cos(angle), r * math.sin(angle)))
+        r = size / 2
         return visual.ShapeStim(
-            win, vertices=vertices,
+            win, vertices=[(r * x, r * y) for x, y in _STAR_UNIT],
             fillColor=color, lineColor=color,
             units="height",
         )
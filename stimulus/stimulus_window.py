@@ -11,12 +11,23 @@ from __future__ import annotations
 
 import logging
 import threading
-from typing import Dict
+from typing import Callable, Dict
 
 from core.enums import Shape
+from stimulus.shape_renderer import create_image_stim, create_shape_stim
 
 logger = logging.getLogger(__name__)
 
+# Resolutions already detected, by screen index; screens don't change size
+# between windows, and the probes below can cost tens of ms
+_screen_resolutions: Dict[int, list] = {}
+# SetProcessDPIAware is a once-per-process setting
+_dpi_aware = False
+
+
+def _draw_nothing() -> None:
+    pass
+
 
 class StimulusWindow:
     """PsychoPy fullscreen window for stimulus presentation.
@@ -51,6 +62,9 @@ class StimulusWindow:
             checkTiming=False,  # we measure frame rate ourselves below
         )
         self._stims: Dict[str, object] = {}
+        # ImageStims by file path: one decode + texture upload per image,
+        # however many names share it (stims belong to this window's context)
+        self._image_stims: Dict[str, object] = {}
 
         # Show "Get ready" message while measuring frame rate
         self._show_message("Get ready")
@@ -63,8 +77,19 @@ class StimulusWindow:
         """Detect the resolution of the target screen.
 
         Tries multiple backends (Qt, tkinter, ctypes) so this works on
-        any PC regardless of what GUI toolkit is available.
+        any PC regardless of what GUI toolkit is available. The result is
+        cached per screen for later windows.
         """
+        res = _screen_resolutions.get(screen)
+        if res is None:
+            res = _screen_resolutions[screen] = (
+                StimulusWindow._probe_screen_resolution(screen)
+            )
+        return list(res)
+
+    @staticmethod
+    def _probe_screen_resolution(screen: int) -> list:
+        global _dpi_aware
         try:
             from PyQt5.QtWidgets import QApplication
             app = QApplication.instance()
@@ -92,7 +117,9 @@ class StimulusWindow:
         try:
             import ctypes
             user32 = ctypes.windll.user32
-            user32.SetProcessDPIAware()
+            if not _dpi_aware:
+                user32.SetProcessDPIAware()
+                _dpi_aware = True
             res = [user32.GetSystemMetrics(0), user32.GetSystemMetrics(1)]
             logger.info("Screen resolution (ctypes): %s", res)
             return res
@@ -170,16 +197,29 @@ class StimulusWindow:
 
     def prepare_shape(self, shape: Shape, color: str = "white") -> None:
         """Pre-build a PsychoPy stimulus for the given shape."""
-        from stimulus.shape_renderer import create_shape_stim
         self._stims[shape.value] = create_shape_stim(self._win, shape, color=color)
         logger.debug("Prepared stimulus: %s (color=%s)", shape.value, color)
 
     def prepare_image(self, name: str, image_path: str) -> None:
         """Pre-build a PsychoPy ImageStim for an image file."""
-        from stimulus.shape_renderer import create_image_stim
-        self._stims[name] = create_image_stim(self._win, image_path)
+        stim = self._image_stims.get(image_path)
+        if stim is None:
+            stim = self._image_stims[image_path] = create_image_stim(
+                self._win, image_path,
+            )
+        self._stims[name] = stim
         logger.debug("Prepared image stimulus: %s -> %s", name, image_path)
 
+    def shape_drawer(self, shape_name: str) -> Callable[[], None]:
+        """Return a no-argument callable that draws *shape_name*.
+
+        For frame loops that draw the same stimulus repeatedly: the
+        stimulus is looked up once here instead of on every draw. Draws
+        nothing if the shape was never prepared, like ``draw_shape``.
+        """
+        stim = self._stims.get(shape_name)
+        return stim.draw if stim else _draw_nothing
+
     def draw_shape(self, shape_name: str) -> None:
         """Draw a pre-built shape to the back-buffer (does NOT flip)."""
         stim = self._stims.get(shape_name)
@@ -206,6 +246,7 @@ class StimulusWindow:
     def close(self) -> None:
         """Close the PsychoPy window and release the OpenGL context."""
         self._stims.clear()
+        self._image_stims.clear()
         if self._win is None:
             return
         try:
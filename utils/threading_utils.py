@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import os
+import sys
 import threading
 from typing import Optional
 
@@ -10,6 +12,39 @@ from PyQt5.QtCore import QThread, pyqtSignal
 from core.enums import ExperimentState, TrialPhase, Shape
 
 
+# Windows THREAD_PRIORITY_HIGHEST; TIME_CRITICAL would compete with the
+# stimulus thread's flips
+_WIN_THREAD_PRIORITY = 2
+# Linux nice value for the same relative boost; SCHED_FIFO would preempt
+# every normal thread, the stimulus and GUI threads included
+_LINUX_NICE = -5
+
+
+def boost_current_thread() -> bool:
+    """Raise the calling thread's OS scheduling priority, best effort.
+
+    Windows: THREAD_PRIORITY_HIGHEST. Linux: a nice value of -5 for the
+    thread, which needs CAP_SYS_NICE or a matching RLIMIT_NICE. Either
+    way the thread stays in the normal scheduling class. Returns True if
+    the priority was raised; any failure leaves the thread as it was.
+    """
+    if sys.platform == "win32":
+        try:
+            import ctypes
+            kernel32 = ctypes.windll.kernel32
+            return bool(kernel32.SetThreadPriority(
+                kernel32.GetCurrentThread(), _WIN_THREAD_PRIORITY,
+            ))
+        except Exception:
+            return False
+    try:
+        # On Linux a thread id addresses just that thread
+        os.setpriority(os.PRIO_PROCESS, threading.get_native_id(), _LINUX_NICE)
+        return True
+    except (AttributeError, OSError):
+        return False
+
+
 class AtomicFlag:
     """Thread-safe boolean flag."""
 
@@ -37,3 +37,14 @@ def precise_sleep(duration: float) -> None:
 def perf_timestamp() -> float:
     """Return a high-resolution monotonic timestamp (seconds)."""
     return time.perf_counter()
+
+
+def ptb_clock_offset() -> float:
+    """Return ``GetSecs() - perf_counter()`` for the Psychtoolbox clock.
+
+    Add it to a ``perf_counter`` timestamp to get the same instant on the
+    clock PTB audio schedules against.  Raises ImportError if the
+    psychtoolbox package is missing.
+    """
+    from psychtoolbox import GetSecs
+    return GetSecs() - time.perf_counter()